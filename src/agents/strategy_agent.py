@@ -3,16 +3,159 @@ Strategy Agent
 Handles all strategy-based trading decisions.
 """
 
+import atexit
 import json
+import logging
 import os
 import re
+import sys
 import time
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from termcolor import cprint
 
 from src.config import *
 from src.models import model_factory
 
+# Precompiled once - skips re's per-call pattern-cache lookup
+_DECISION_SPLIT_RE = re.compile(r"[;,]")
+
+# Module logger with deferred %-formatting - per-token log lines cost
+# nothing when the level gates them off, unlike eagerly-built f-strings.
+# Defaults to INFO on stdout so the dashboard output looks unchanged.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(os.getenv("STRATEGY_AGENT_LOG_LEVEL", "INFO"))
+    logger.propagate = False
+
+# ============================================================
+# ⚡ orjson for fast prompt serialization (optional)
+# ============================================================
+# Prompt JSON is compact - the LLM doesn't need whitespace, and indented
+# output roughly doubles both serialize cost and prompt token count.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
+# ============================================================
+# 🚀 Numba kernel for batch portfolio combination (optional)
+# ============================================================
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _combine_kernel(ids, deltas, signs, current):
+        for i in range(ids.shape[0]):
+            idx = ids[i]
+            current[idx] = max(current[idx] + deltas[i] * signs[i], 0.0)
+        return current
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMBA_AVAILABLE = False
+
+# Below this many signals the plain dict loop beats the array setup cost
+_COMBINE_BATCH_MIN = 64
+
+
+# ============================================================
+# 📐 Columnar signal batch (SoA view for vectorized aggregation)
+# ============================================================
+@dataclass
+class SignalBatch:
+    """Columnar (struct-of-arrays) view of a list of signal dicts.
+
+    Large batches aggregate via NumPy masks instead of per-dict key
+    lookups; small batches stay on the plain dict path.
+    """
+    tokens: list
+    strategy_names: list
+    confidences: "np.ndarray"
+    directions: "np.ndarray"     # int8: 1=BUY, -1=SELL, 0=NONE
+    allocation_pct: "np.ndarray"
+
+    @classmethod
+    def from_signals(cls, raw_signals):
+        n = len(raw_signals)
+        tokens = []
+        names = []
+        confidences = np.empty(n, dtype=np.float64)
+        directions = np.zeros(n, dtype=np.int8)
+        allocation_pct = np.empty(n, dtype=np.float64)
+
+        for i, s in enumerate(raw_signals):
+            tokens.append(s.get("token", ""))
+            names.append(s.get("name", s.get("strategy_name", "")))
+            confidences[i] = float(s.get("confidence", 0) or 0)
+            allocation_pct[i] = float(s.get("suggested_allocation_pct", 0) or 0)
+            direction = (s.get("direction") or "").upper()
+            if direction == "BUY":
+                directions[i] = 1
+            elif direction == "SELL":
+                directions[i] = -1
+
+        return cls(tokens, names, confidences, directions, allocation_pct)
+
+    def aggregate(self):
+        """Vectorized buy/sell confidence sums, counts and allocation total."""
+        buy_mask = self.directions == 1
+        sell_mask = self.directions == -1
+        return (
+            float(self.confidences[buy_mask].sum()), int(buy_mask.sum()),
+            float(self.confidences[sell_mask].sum()), int(sell_mask.sum()),
+            float(self.allocation_pct.sum()),
+        )
+
+# ============================================================
+# 🗃️ Per-cycle caches (prompt fragments + market data)
+# ============================================================
+# Serialized signal JSON keyed by a frozen view of the signal dicts -
+# identical signals across calls skip the json.dumps entirely.
+_signals_json_cache = {}
+_SIGNALS_JSON_CACHE_MAX = 64
+
+
+def _freeze(obj):
+    """Recursively convert dicts/lists into hashable tuples for cache keys."""
+    if isinstance(obj, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _serialize_signals(signals):
+    """Return the compact JSON for signals, memoized on their content."""
+    key = _freeze(signals)
+    cached = _signals_json_cache.get(key)
+    if cached is None:
+        cached = _dumps(signals)
+        if len(_signals_json_cache) >= _SIGNALS_JSON_CACHE_MAX:
+            _signals_json_cache.clear()
+        _signals_json_cache[key] = cached
+    return cached
+
+
+def _get_market_data(token):
+    """Fetch market data for a token via the shared TTL-cached OHLCV fetch."""
+    from src.utils.market_cache import get_ohlcv
+    return get_ohlcv(token)
+
 # ============================================================
 # 🏦 Exchange Manager (optional)
 # ============================================================
@@ -58,6 +201,11 @@ Remember:
 - Better to reject a signal than risk a bad trade.
 """
 
+# Pre-split the template at import so each call joins constant segments
+# with the two dynamic values instead of re-parsing the format string
+_EVAL_HEAD, _eval_rest = STRATEGY_EVAL_PROMPT.split("{strategy_signals}")
+_EVAL_MID, _EVAL_TAIL = _eval_rest.split("{market_data}")
+
 
 # ============================================================
 # ⚙️ Strategy Agent
@@ -98,11 +246,105 @@ class StrategyAgent:
         else:
             print("✅ Strategy Agent is disabled in config.py")
 
+        # --- Thread pool for parallel signal generation ---
+        # Strategies are independent and usually I/O-bound (price feeds),
+        # so fan them out instead of summing their latencies.
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(len(self.enabled_strategies), 1),
+            thread_name_prefix="strategy"
+        )
+        atexit.register(self._pool.shutdown, wait=False)
+
+        # Second-resolution UTC timestamp cache for enriched contexts -
+        # bursts within the same second reuse one formatted string
+        self._iso_cache_second = -1
+        self._iso_cache_value = ""
+
+        # --- Token index ---
+        # Strategies that declare supported_tokens are only polled for
+        # those tokens; the rest get polled for everything as before.
+        self._strategies_by_token = {}
+        self._universal_strategies = []
+        for strategy in self.enabled_strategies:
+            supported = getattr(strategy, "supported_tokens", None)
+            if supported:
+                for tok in supported:
+                    self._strategies_by_token.setdefault(tok, []).append(strategy)
+            else:
+                self._universal_strategies.append(strategy)
+
         print(f"✅ Strategy Agent initialized with {len(self.enabled_strategies)} strategies!")
 
+    # ============================================================
+    # 🔀 Parallel signal generation helper
+    # ============================================================
+    def _strategies_for(self, token):
+        """Strategies worth polling for a token (indexed + universal)."""
+        if token is None:
+            return self.enabled_strategies
+        return self._strategies_by_token.get(token, []) + self._universal_strategies
+
+    def _generate_all_signals(self, token=None):
+        """Run the relevant strategies' generate_signals() in parallel.
+
+        Token-specific strategies are skipped for other tokens.
+
+        Returns:
+            list[tuple]: (strategy, signal) pairs; failed strategies are skipped.
+        """
+        results = []
+        futures = {
+            self._pool.submit(strategy.generate_signals): strategy
+            for strategy in self._strategies_for(token)
+        }
+        for future in as_completed(futures):
+            strategy = futures[future]
+            try:
+                results.append((strategy, future.result()))
+            except Exception as e:
+                logger.warning("⚠️ Strategy %s error: %s", getattr(strategy, "name", "unknown"), e)
+        return results
+
     # ============================================================
     # 🧮 Evaluate signals using LLM
     # ============================================================
+    # How much reasoning to keep after the decision line before dropping
+    # the rest of the stream - it's only ever printed as a preview
+    _REASONING_STREAM_BUDGET = 500
+
+    def _consume_decision_stream(self, chunks):
+        """
+        Parse decisions from the first streamed line, then stop early.
+
+        The decision line arrives long before the full completion; the
+        remaining reasoning is log-only, so the stream is abandoned once
+        a short preview has accumulated.
+
+        Returns:
+            tuple: (decisions list, reasoning str)
+        """
+        buffer = ""
+        decisions = None
+        for chunk in chunks:
+            buffer += chunk
+            if decisions is None:
+                if "\n" in buffer:
+                    first_line, buffer = buffer.split("\n", 1)
+                    decisions = [
+                        d.strip()
+                        for d in _DECISION_SPLIT_RE.split(first_line.strip())
+                        if d.strip()
+                    ]
+            elif len(buffer) >= self._REASONING_STREAM_BUDGET:
+                break
+
+        if decisions is None:
+            # Response never contained a newline - the whole buffer is the decision line
+            line = buffer.strip()
+            decisions = [d.strip() for d in _DECISION_SPLIT_RE.split(line) if d.strip()]
+            buffer = ""
+
+        return decisions, buffer.strip()
     def evaluate_signals(self, signals, market_data):
         """
         Evaluate strategy signals using the project's model_factory (OpenAI).
@@ -114,51 +356,44 @@ class StrategyAgent:
             if not signals:
                 return None
 
-            signals_str = json.dumps(signals, indent=2)
-            market_json = json.dumps(market_data or {}, indent=2)
+            signals_str = _serialize_signals(signals)
+            market_json = _dumps(market_data or {})
 
-            prompt = STRATEGY_EVAL_PROMPT.format(
-                strategy_signals=signals_str,
-                market_data=market_json
-            )
+            prompt = "".join((_EVAL_HEAD, signals_str, _EVAL_MID, market_json, _EVAL_TAIL))
+
+            # Indented JSON only for humans reading debug logs
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📝 Eval signals:\n%s", json.dumps(signals, indent=2, default=str))
 
             model = model_factory.get_model(AI_MODEL_TYPE, AI_MODEL_NAME)
             if not model:
-                print("❌ model_factory could not return model for strategy evaluation")
+                logger.error("❌ model_factory could not return model for strategy evaluation")
                 return None
 
-            resp = model.generate_response(
-                system_prompt=STRATEGY_EVAL_PROMPT,
-                user_content=prompt,
-                temperature=AI_TEMPERATURE,
-                max_tokens=AI_MAX_TOKENS
+            # --- Stream the response; only the first line drives trading ---
+            decisions, reasoning = self._consume_decision_stream(
+                model.generate_response_stream(
+                    system_prompt=STRATEGY_EVAL_PROMPT,
+                    user_content=prompt,
+                    temperature=AI_TEMPERATURE,
+                    max_tokens=AI_MAX_TOKENS
+                )
             )
 
-            response_text = getattr(resp, "content", str(resp))
-            if not response_text:
-                print("❌ Empty AI response for strategy evaluation")
+            if not decisions:
+                logger.error("❌ Empty AI response for strategy evaluation")
                 return None
 
-            # --- Parse the response ---
-            lines = response_text.splitlines()
-            if not lines:
-                return None
-
-            decisions_line = lines[0].strip()
-            decisions = [d.strip() for d in re.split(r"[;,]", decisions_line) if d.strip()]
-            reasoning = "\n".join(lines[1:]).strip() if len(lines) > 1 else ""
-
             # --- Logging ---
-            print("📊 Strategy Evaluation (AI):")
-            print(f"Decisions: {decisions}")
-            print(f"Reasoning (preview): {reasoning[:300]}")
+            logger.info("📊 Strategy Evaluation (AI):")
+            logger.info("Decisions: %s", decisions)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Reasoning (preview): %s", reasoning[:300])
 
             return {"decisions": decisions, "reasoning": reasoning}
 
         except Exception as e:
-            print(f"❌ Error evaluating signals: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ Error evaluating signals: %s", e, exc_info=True)
             return None
 
     # ============================================================
@@ -168,10 +403,9 @@ class StrategyAgent:
         """Collect and evaluate signals from all enabled strategies."""
         try:
             signals = []
-            print(f"\n🔍 Analyzing {token} with {len(self.enabled_strategies)} strategies...")
+            logger.info("\n🔍 Analyzing %s with %s strategies...", token, len(self.enabled_strategies))
 
-            for strategy in self.enabled_strategies:
-                signal = strategy.generate_signals()
+            for strategy, signal in self._generate_all_signals(token):
                 if signal and signal["token"] == token:
                     signals.append({
                         "token": signal["token"],
@@ -182,58 +416,104 @@ class StrategyAgent:
                     })
 
             if not signals:
-                print(f"ℹ️ No strategy signals for {token}")
+                logger.info("ℹ️ No strategy signals for %s", token)
                 return []
 
-            print(f"\n📊 Raw Strategy Signals for {token}:")
-            for s in signals:
-                print(f"   • {s['strategy_name']}: {s['direction']} ({s['signal']})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n📊 Raw Strategy Signals for %s:", token)
+                for s in signals:
+                    logger.debug("   • %s: %s (%s)", s["strategy_name"], s["direction"], s["signal"])
 
-            # --- Market data for context ---
+            # --- Market data for context (60s TTL cache) ---
             try:
-                from src.data.ohlcv_collector import collect_token_data
-                market_data = collect_token_data(token)
+                market_data = _get_market_data(token)
             except Exception as e:
-                print(f"⚠️ Could not get market data: {e}")
+                logger.warning("⚠️ Could not get market data: %s", e)
                 market_data = {}
 
             # --- AI evaluation ---
-            print("\n📊 Getting LLM evaluation of signals...")
+            logger.info("\n📊 Getting LLM evaluation of signals...")
             evaluation = self.evaluate_signals(signals, market_data)
             if not evaluation:
-                print("❌ Failed to get LLM evaluation")
+                logger.error("❌ Failed to get LLM evaluation")
                 return []
 
             # --- Filter based on AI approval ---
             approved_signals = []
             for signal, decision in zip(signals, evaluation["decisions"]):
                 if "EXECUTE" in decision.upper():
-                    print(f"✅ LLM approved {signal['strategy_name']}'s {signal['direction']} signal")
+                    logger.info("✅ LLM approved %s's %s signal", signal["strategy_name"], signal["direction"])
                     approved_signals.append(signal)
                 else:
-                    print(f"❌ LLM rejected {signal['strategy_name']}'s {signal['direction']} signal")
+                    logger.info("❌ LLM rejected %s's %s signal", signal["strategy_name"], signal["direction"])
 
             # --- Optional execution ---
             if approved_signals:
-                print(f"\n🎯 Final Approved Signals for {token}:")
-                for s in approved_signals:
-                    print(f"   • {s['strategy_name']}: {s['direction']} ({s['signal']})")
+                logger.info("\n🎯 Final Approved Signals for %s:", token)
+                if logger.isEnabledFor(logging.DEBUG):
+                    for s in approved_signals:
+                        logger.debug("   • %s: %s (%s)", s["strategy_name"], s["direction"], s["signal"])
 
                 if self.execute_signals:
-                    print("\n💫 Executing approved strategy signals...")
+                    logger.info("\n💫 Executing approved strategy signals...")
                     self.execute_strategy_signals(approved_signals)
             else:
-                print(f"\n⚠️ No signals approved by LLM for {token}")
+                logger.info("\n⚠️ No signals approved by LLM for %s", token)
 
             return approved_signals
 
         except Exception as e:
-            print(f"❌ Error getting strategy signals: {e}")
+            logger.error("❌ Error getting strategy signals: %s", e)
             return []
 
+    # ============================================================
+    # 🚀 Concurrent multi-token evaluation
+    # ============================================================
+    def evaluate_all(self, tokens, max_workers=6):
+        """
+        Run get_signals for several tokens concurrently.
+
+        Each token's LLM evaluation is independent, so fanning them out
+        collapses the serial ~10s-per-token wall clock to roughly one
+        call's latency. max_workers stays modest to respect rate limits.
+
+        Returns:
+            dict: token -> approved signals list ([] on failure).
+        """
+        results = {}
+        if not tokens:
+            return results
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(tokens)),
+            thread_name_prefix="eval"
+        ) as pool:
+            futures = {pool.submit(self.get_signals, token): token for token in tokens}
+            for future in as_completed(futures):
+                token = futures[future]
+                try:
+                    results[token] = future.result()
+                except Exception as e:
+                    logger.error("❌ evaluate_all error for %s: %s", token, e)
+                    results[token] = []
+
+        return results
+
     # ============================================================
     # 🧱 Enriched Context for TradingAgent
     # ============================================================
+    def _utc_iso(self):
+        """UTC timestamp at second resolution, cached within the same second.
+
+        time.strftime over gmtime is C-implemented and skips the
+        datetime allocation; repeat calls in a burst hit the cache.
+        """
+        now = int(time.time())
+        if now != self._iso_cache_second:
+            self._iso_cache_second = now
+            self._iso_cache_value = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        return self._iso_cache_value
+
     def get_enriched_context(self, token):
         """
         Return enriched, non-executing strategy context for TradingAgent.
@@ -241,13 +521,7 @@ class StrategyAgent:
         try:
             raw_signals = []
 
-            for strategy in self.enabled_strategies:
-                try:
-                    signal = strategy.generate_signals()
-                except Exception as e:
-                    print(f"⚠️ Strategy {getattr(strategy, 'name', 'unknown')} error: {e}")
-                    continue
-
+            for strategy, signal in self._generate_all_signals(token):
                 if not signal or signal.get("token") != token:
                     continue
 
@@ -265,18 +539,32 @@ class StrategyAgent:
             if not raw_signals:
                 return None
 
-            buy_confs = [s["confidence"] for s in raw_signals if s["direction"] and s["direction"].upper() == "BUY"]
-            sell_confs = [s["confidence"] for s in raw_signals if s["direction"] and s["direction"].upper() == "SELL"]
-            all_confs = buy_confs + sell_confs
-
-            direction_bias = "BUY" if sum(buy_confs) >= sum(sell_confs) else "SELL"
-            avg_conf = round((sum(all_confs) / len(all_confs)) if all_confs else 0, 4)
-            suggested_alloc = round(
-                min(sum(s.get("suggested_allocation_pct", 0) for s in raw_signals), 1.0), 4
-            )
+            if np is not None and len(raw_signals) >= _COMBINE_BATCH_MIN:
+                # Columnar path: masked NumPy sums, no per-dict key lookups
+                batch = SignalBatch.from_signals(raw_signals)
+                buy_sum, buy_n, sell_sum, sell_n, alloc_sum = batch.aggregate()
+            else:
+                # Single pass over raw_signals - accumulate everything at once
+                # instead of three separate comprehensions
+                buy_sum = sell_sum = alloc_sum = 0.0
+                buy_n = sell_n = 0
+                for s in raw_signals:
+                    direction = (s["direction"] or "").upper()
+                    if direction == "BUY":
+                        buy_sum += s["confidence"]
+                        buy_n += 1
+                    elif direction == "SELL":
+                        sell_sum += s["confidence"]
+                        sell_n += 1
+                    alloc_sum += s.get("suggested_allocation_pct", 0)
+
+            total_n = buy_n + sell_n
+            direction_bias = "BUY" if buy_sum >= sell_sum else "SELL"
+            avg_conf = round(((buy_sum + sell_sum) / total_n) if total_n else 0, 4)
+            suggested_alloc = round(min(alloc_sum, 1.0), 4)
             conflict_level = (
-                "low" if buy_confs and not sell_confs
-                else "high" if buy_confs and sell_confs
+                "low" if buy_n and not sell_n
+                else "high" if buy_n and sell_n
                 else "none"
             )
 
@@ -290,25 +578,58 @@ class StrategyAgent:
                     "conflict_level": conflict_level,
                     "notes": "Generated by StrategyAgent.get_enriched_context()"
                 },
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": self._utc_iso()
             }
 
             return enriched
 
         except Exception as e:
-            print(f"❌ get_enriched_context error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("❌ get_enriched_context error: %s", e, exc_info=True)
             return None
 
     # ============================================================
     # 💰 Portfolio Combination Helper
     # ============================================================
+    def _combine_batch(self, signals, final_allocations):
+        """Numba path for large signal batches: SoA arrays + compiled loop."""
+        token_ids = {}
+        for token in final_allocations:
+            token_ids.setdefault(token, len(token_ids))
+        for signal in signals:
+            token_ids.setdefault(signal["token"], len(token_ids))
+
+        current = np.zeros(len(token_ids), dtype=np.float64)
+        for token, idx in token_ids.items():
+            current[idx] = final_allocations.get(token, 0)
+
+        ids = np.empty(len(signals), dtype=np.int32)
+        deltas = np.empty(len(signals), dtype=np.float64)
+        signs = np.empty(len(signals), dtype=np.float64)
+        kept = 0
+        for signal in signals:
+            direction = signal["direction"]
+            if direction == "BUY":
+                sign = 1.0
+            elif direction == "SELL":
+                sign = -1.0
+            else:
+                continue
+            ids[kept] = token_ids[signal["token"]]
+            deltas[kept] = signal["signal"]
+            signs[kept] = sign
+            kept += 1
+
+        _combine_kernel(ids[:kept], deltas[:kept], signs[:kept], current)
+        return {token: current[idx] for token, idx in token_ids.items()}
+
     def combine_with_portfolio(self, signals, current_portfolio):
         """Combine strategy signals with the current portfolio state."""
         try:
             final_allocations = current_portfolio.copy()
 
+            if NUMBA_AVAILABLE and len(signals) >= _COMBINE_BATCH_MIN:
+                return self._combine_batch(signals, final_allocations)
+
             for signal in signals:
                 token = signal["token"]
                 strength = signal["signal"]
@@ -322,5 +643,5 @@ class StrategyAgent:
             return final_allocations
 
         except Exception as e:
-            print(f"❌ combine_with_portfolio error: {e}")
+            logger.error("❌ combine_with_portfolio error: %s", e)
             return current_portfolio
@@ -224,6 +224,66 @@ class SwarmAgent:
                 "response_time": round(elapsed, 2)
             }
 
+    def _query_model_group(self, providers: list, model_info: Dict, prompt: str,
+                           system_prompt: Optional[str] = None) -> list:
+        """
+        Query one model once for several swarm slots via multi-sampling
+
+        When multiple slots share the same (provider type, model name), a
+        single request with n=len(providers) replaces one HTTP round-trip
+        per slot. Returns a list of (provider_name, response_dict) tuples.
+        """
+        start_time = time.time()
+
+        if system_prompt is None:
+            system_prompt = "You are a helpful AI assistant providing thoughtful analysis."
+
+        try:
+            contents = model_info["model"].generate_response_n(
+                system_prompt=system_prompt,
+                user_content=prompt,
+                temperature=DEFAULT_TEMPERATURE,
+                max_tokens=DEFAULT_MAX_TOKENS,
+                n=len(providers)
+            )
+            elapsed = round(time.time() - start_time, 2)
+
+            results = []
+            for i, provider in enumerate(providers):
+                content = contents[i] if i < len(contents) else None
+                if content and str(content).strip():
+                    results.append((provider, {
+                        "provider": provider,
+                        "model": model_info["name"],
+                        "response": content,
+                        "success": True,
+                        "error": None,
+                        "response_time": elapsed
+                    }))
+                else:
+                    cprint(f"⚠️ {provider} sample was empty", "yellow")
+                    results.append((provider, {
+                        "provider": provider,
+                        "model": model_info["name"],
+                        "response": None,
+                        "success": False,
+                        "error": "Empty sample from batched response",
+                        "response_time": elapsed
+                    }))
+            return results
+
+        except Exception as e:
+            elapsed = round(time.time() - start_time, 2)
+            cprint(f"❌ Error querying {providers} group: {e}", "red")
+            return [(provider, {
+                "provider": provider,
+                "model": model_info["name"],
+                "response": None,
+                "success": False,
+                "error": str(e),
+                "response_time": elapsed
+            }) for provider in providers]
+
     def query(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
         """
         Query all models in the swarm in parallel
@@ -246,79 +306,101 @@ class SwarmAgent:
         start_time = time.time()
         all_responses = {}
 
-        # Use ThreadPoolExecutor for parallel queries
-        with ThreadPoolExecutor(max_workers=len(self.active_models)) as executor:
-            # Submit all queries
-            futures = {
-                executor.submit(
-                    self._query_single_model,
-                    provider,
-                    model_info,
-                    prompt,
-                    system_prompt
-                ): provider
-                for provider, model_info in self.active_models.items()
-            }
+        # Group slots that share the same (provider type, model name) so one
+        # multi-sample request serves all of them instead of one call per slot
+        model_groups = {}
+        for provider, model_info in self.active_models.items():
+            model_groups.setdefault((model_info["type"], model_info["name"]), []).append(provider)
+
+        # Use ThreadPoolExecutor for parallel queries (one worker per distinct model)
+        with ThreadPoolExecutor(max_workers=len(model_groups)) as executor:
+            # Submit one query per model group
+            futures = {}
+            for group_providers in model_groups.values():
+                model_info = self.active_models[group_providers[0]]
+                if len(group_providers) == 1:
+                    future = executor.submit(
+                        self._query_single_model,
+                        group_providers[0],
+                        model_info,
+                        prompt,
+                        system_prompt
+                    )
+                else:
+                    cprint(f"♾️ Batching {len(group_providers)} slots of {model_info['name']} into one request", "cyan")
+                    future = executor.submit(
+                        self._query_model_group,
+                        group_providers,
+                        model_info,
+                        prompt,
+                        system_prompt
+                    )
+                futures[future] = group_providers
 
             # Track which models are still pending
             completed_count = 0
-            total_models = len(futures)
+            total_models = len(self.active_models)
 
             # Collect results as they complete (with timeout handling)
             try:
                 for future in as_completed(futures, timeout=MODEL_TIMEOUT + 10):
-                    provider = futures[future]
-                    completed_count += 1
-
-                    cprint(f"\n♾️ Waiting for responses... ({completed_count}/{total_models} completed)", "yellow")
-                    cprint(f"♾️ Processing: {provider}...", "cyan")
+                    group_providers = futures[future]
 
                     try:
-                        provider, response = future.result(timeout=5)  # 5 second timeout per result
-                        all_responses[provider] = response
+                        result = future.result(timeout=5)  # 5 second timeout per result
+                        if isinstance(result, tuple):
+                            result = [result]  # single-model path returns one (provider, response)
+
+                        for provider, response in result:
+                            all_responses[provider] = response
+                            completed_count += 1
 
-                        if response["success"]:
-                            cprint(f"   ♾️ {provider} responded ({response['response_time']}s)", "green")
-                        else:
-                            cprint(f"   ♾️ {provider} failed: {response['error']}", "red")
+                            cprint(f"\n♾️ Waiting for responses... ({completed_count}/{total_models} completed)", "yellow")
+                            if response["success"]:
+                                cprint(f"   ♾️ {provider} responded ({response['response_time']}s)", "green")
+                            else:
+                                cprint(f"   ♾️ {provider} failed: {response['error']}", "red")
 
                     except TimeoutError:
-                        cprint(f"   ⏰ {provider} timed out (>{MODEL_TIMEOUT}s) - skipping", "yellow")
-                        all_responses[provider] = {
-                            "provider": provider,
-                            "model": "timeout",
-                            "response": None,
-                            "success": False,
-                            "error": f"Timeout after {MODEL_TIMEOUT}s",
-                            "response_time": MODEL_TIMEOUT
-                        }
+                        for provider in group_providers:
+                            cprint(f"   ⏰ {provider} timed out (>{MODEL_TIMEOUT}s) - skipping", "yellow")
+                            all_responses[provider] = {
+                                "provider": provider,
+                                "model": "timeout",
+                                "response": None,
+                                "success": False,
+                                "error": f"Timeout after {MODEL_TIMEOUT}s",
+                                "response_time": MODEL_TIMEOUT
+                            }
                     except Exception as e:
-                        cprint(f"   💥 {provider} error: {str(e)}", "red")
-                        all_responses[provider] = {
-                            "provider": provider,
-                            "model": "error",
-                            "response": None,
-                            "success": False,
-                            "error": str(e),
-                            "response_time": 0
-                        }
+                        for provider in group_providers:
+                            cprint(f"   💥 {provider} error: {str(e)}", "red")
+                            all_responses[provider] = {
+                                "provider": provider,
+                                "model": "error",
+                                "response": None,
+                                "success": False,
+                                "error": str(e),
+                                "response_time": 0
+                            }
 
             except TimeoutError as timeout_error:
                 # as_completed timed out waiting for all futures
                 cprint(f"\n⏰ Overall timeout reached - some models didn't respond", "yellow")
                 cprint(f"⚠️ {str(timeout_error)}", "yellow")
                 # Mark any remaining futures as timed out
-                for future, provider in futures.items():
-                    if provider not in all_responses:
-                        cprint(f"   ⏰ {provider} never responded - marking as timeout", "red")
-                        all_responses[provider] = {
-                            "provider": provider,
-                            "model": "timeout",
-                            "response": None,
-                            "success": False,
-                            "error": f"Global timeout - no response received",
-                            "response_time": MODEL_TIMEOUT
-                        }
+                for future, group_providers in futures.items():
+                    for provider in group_providers:
+                        if provider not in all_responses:
+                            cprint(f"   ⏰ {provider} never responded - marking as timeout", "red")
+                            all_responses[provider] = {
+                                "provider": provider,
+                                "model": "timeout",
+                                "response": None,
+                                "success": False,
+                                "error": f"Global timeout - no response received",
+                                "response_time": MODEL_TIMEOUT
+                            }
                 # 🌙 Moon Dev - Don't raise, continue with partial results
                 cprint(f"♾️ Continuing with {len([r for r in all_responses.values() if r['success']])} successful responses", "green")
 
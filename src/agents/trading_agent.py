@@ -15,27 +15,96 @@ SWARM MODE (Consensus - ~45-60 seconds per token):
    - Best for: Higher confidence trades, 15-minute+ timeframes
 """
 
+import hashlib
+import io
 import os
 import sys
 import json
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
+
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import re
+import traceback
+
+# orjson parses AI responses ~2x faster than stdlib json - optional
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_indent(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_indent(obj):
+        return json.dumps(obj, indent=2)
+
+# Precompiled once - skips re's per-call pattern-cache lookup
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Swarm vote parsing: one case-insensitive anchored match captures the
+# action and the "| XX%" confidence in a single pass, so the hot path
+# needs no .upper() copy and no partition/startswith cascade. The map
+# folds the synonym actions (first letter is enough) down to BUY/SELL,
+# everything else is NOTHING.
+_CONF_RE = re.compile(r"(\d+)")
+_VOTE_RE = re.compile(
+    r"^\s*(?P<act>BUY|SELL|DO\s+NOTHING|NOTHING|HOLD|WAIT)\b[^|\n]*"
+    r"(?:\|[^\d\n]*(?P<conf>\d+))?",
+    re.I,
+)
+_ACTION_MAP = {"B": "BUY", "S": "SELL"}
+
+# Single-model responses state confidence in prose ("Confidence: 85%") -
+# one search replaces the per-line lower() + substring + filter(str.isdigit)
+_CONFIDENCE_LINE_RE = re.compile(r"confidence[^0-9]{0,20}(\d{1,3})", re.IGNORECASE)
+
+# Close-price column aliases across data sources, in preference order
+_CLOSE_COL_CANDIDATES = ("Close", "close", "close_price", "c", "price")
+
+# Fixed vote domain for consensus tallies - indexed slots instead of
+# per-vote dict-of-lists bookkeeping
+_SWARM_ACTS = ("BUY", "SELL", "NOTHING")
+_SWARM_ACT_IDX = {a: i for i, a in enumerate(_SWARM_ACTS)}
+
+# Memoized parses keyed by response hash - retry paths feed the same text
+# through here more than once
+_json_extract_cache = {}
+_JSON_EXTRACT_CACHE_MAX = 256
 
 
 def extract_json_from_text(text):
     """Safely extract JSON object from AI model responses containing text."""
-    match = re.search(r"\{.*\}", text, re.DOTALL)
+    key = hash(text)
+    if key in _json_extract_cache:
+        return _json_extract_cache[key]
+
+    match = _JSON_BLOCK_RE.search(text)
     if match:
         try:
-            return json.loads(match.group())
-        except json.JSONDecodeError:
-            print("⚠️ JSON extraction failed even after matching braces.")
-            return None
-    print("⚠️ No JSON object found in AI response.")
-    return None
+            result = _loads(match.group())
+        except ValueError:
+            # orjson is stricter than stdlib (NaN, big ints) - retry with
+            # json before giving up
+            try:
+                result = json.loads(match.group())
+            except ValueError:
+                print("⚠️ JSON extraction failed even after matching braces.")
+                result = None
+    else:
+        print("⚠️ No JSON object found in AI response.")
+        result = None
+
+    if len(_json_extract_cache) >= _JSON_EXTRACT_CACHE_MAX:
+        _json_extract_cache.clear()
+    _json_extract_cache[key] = result
+    return result
 
 
 # ============================================================================
@@ -48,19 +117,23 @@ if project_root not in sys.path:
 # ============================================================================
 
 # 👇 NOW you can import from src safely
-from src.models import model_factory
-from src.agents.swarm_agent import SwarmAgent
-from src.data.ohlcv_collector import collect_all_tokens
-from src.agents.strategy_agent import StrategyAgent
+# model_factory, SwarmAgent, StrategyAgent and collect_all_tokens are heavy
+# (they pull in the LLM clients and pandas stack) and only matter once a
+# TradingAgent actually runs - they're imported lazily at their call sites
+# so `import trading_agent` stays cheap for CLIs and workers.
 
 # Import shared logging utility (prevents circular import with trading_app)
 try:
-    from src.utils.logging_utils import add_console_log, log_position_open
+    from src.utils.logging_utils import add_console_log, add_console_logs_bulk, log_position_open
 except ImportError:
     # Fallback if running standalone without trading_app
     def add_console_log(message, level="info", console_file=None):
         print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
 
+    def add_console_logs_bulk(entries):
+        for message, level in entries:
+            add_console_log(message, level)
+
     def log_position_open(symbol, side, size_usd, console_file=None):
         emoji = "📈" if side == "LONG" else "📉"
         print(f"[{datetime.now().strftime('%H:%M:%S')}] {emoji} Opened {side} {symbol} ${size_usd:.2f}")
@@ -127,11 +200,14 @@ load_dotenv()
 # 🔧 OPTIONAL: COLOR PRINT & PANDAS SHIM (Keep your existing helpers)
 # ============================================================================
 try:
-    from termcolor import cprint
+    from termcolor import colored, cprint
 except Exception:
     def cprint(msg, *args, **kwargs):
         print(msg)
 
+    def colored(msg, *args, **kwargs):
+        return msg
+
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
@@ -162,10 +238,12 @@ except Exception as e:
         def to_string(self):
             if not self._data:
                 return "<empty DataFrame>"
-            header = " | ".join(self.columns)
-            lines = [header]
-            for row in self._data:
-                lines.append(" | ".join(str(row.get(c, "")) for c in self.columns))
+            # Hoist the column tuple and bound join out of the per-row loop;
+            # joining materialized lists beats generator joins at this shape
+            cols = tuple(self.columns)
+            join = " | ".join
+            lines = [join(cols)]
+            lines += [join([str(row.get(c, "")) for c in cols]) for row in self._data]
             return "\n".join(lines)
 
         def __str__(self):
@@ -192,7 +270,8 @@ except Exception as e:
 # ============================================================================
 # 🔧 TRADING AGENT CONFIGURATION
 # ============================================================================
-from eth_account import Account
+# eth_account is imported lazily where the Hyperliquid account is built -
+# key derivation machinery isn't needed for the other exchanges
 from src.config import EXCHANGE as CONFIG_EXCHANGE
 
 # 🦈 EXCHANGE SELECTION - Import from config.py
@@ -262,7 +341,7 @@ SLEEP_BETWEEN_RUNS_MINUTES = 5
 # For SOLANA exchange
 USDC_ADDRESS = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v" 
 SOL_ADDRESS = "So11111111111111111111111111111111111111111"    
-EXCLUDED_TOKENS = [USDC_ADDRESS, SOL_ADDRESS]
+EXCLUDED_TOKENS = frozenset({USDC_ADDRESS, SOL_ADDRESS})  # O(1) membership in the cycle loops
 
 MONITORED_TOKENS = []
 
@@ -317,7 +396,17 @@ else:
     cprint("Available exchanges: ASTER, HYPERLIQUID, SOLANA", "yellow")
     sys.exit(1)
 
-from src.data.ohlcv_collector import collect_all_tokens
+# Hot-path exchange functions bound once after the dispatch above - saves a
+# module attribute lookup per call inside the per-symbol loops (None when
+# the selected exchange module doesn't provide them)
+_get_position = getattr(n, 'get_position', None)
+_get_available_balance = getattr(n, 'get_available_balance', None)
+_get_account_value = getattr(n, 'get_account_value', None)
+
+# Integer exchange id resolved once so hot functions branch on an int (or
+# index a dispatch table) instead of re-comparing strings every call
+EXCHANGE_ID = {"SOLANA": 0, "ASTER": 1, "HYPERLIQUID": 2}[EXCHANGE]
+IS_PERP = EXCHANGE_ID != 0
 
 # ============================================================================
 # PROMPTS
@@ -460,6 +549,21 @@ ACTION TYPES:
 
 CRITICAL: Return ONLY the JSON object, no markdown, no explanation outside the JSON."""
 
+# Static fragments of the per-cycle position prompt - joined with the two
+# JSON blocks at call time instead of re-interpolating a large f-string
+_POSITION_PROMPT_PREFIX = "Analyze these open positions:\n\nPOSITIONS:\n"
+_POSITION_PROMPT_MIDDLE = "\n\nCURRENT MARKET CONDITIONS:\n"
+_POSITION_PROMPT_SUFFIX = """
+
+For each position, decide KEEP or CLOSE with reasoning.
+Return ONLY valid JSON with the following structure:
+{
+  "SYMBOL": {
+     "action": "KEEP" or "CLOSE",
+     "reasoning": "short explanation"
+  }
+}"""
+
 POSITION_ANALYSIS_PROMPT = """
 You are an expert crypto trading analyst. Your task is to analyze the user's open positions based on the provided position summaries and current market data.
 
@@ -497,73 +601,365 @@ Respond ONLY with the raw JSON object.
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_account_balance(account=None):
-    """Get account balance in USD based on exchange type"""
+# Balance/sizing diagnostics are pure overhead once balances are cached -
+# off by default, flip LOG_POSITION_CALC=1 to get the full breakdown back
+LOG_POSITION_CALC = os.getenv("LOG_POSITION_CALC", "0") == "1"
+
+# Full per-model reasoning text on the low-confidence swarm exit is only
+# worth assembling when someone will read it - flip SWARM_VERBOSE_REASONING=1
+# to get the complete vote breakdown on downgraded decisions too
+SWARM_VERBOSE_REASONING = os.getenv("SWARM_VERBOSE_REASONING", "0") == "1"
+
+# Per-token analyses are independent and bound by LLM latency - set
+# ANALYSIS_MAX_WORKERS>1 to fan them out on threads (cycle time drops
+# from N*latency toward max latency). Default stays sequential so the
+# per-token console output remains readable.
+ANALYSIS_MAX_WORKERS = int(os.getenv("ANALYSIS_MAX_WORKERS", "1"))
+
+# Console verbosity: banners and decorative lines go through _v(1, ...) so
+# headless runs (AI_AGENT_VERBOSE=0) skip the ANSI formatting and flushes;
+# decision output stays unconditional
+VERBOSE = int(os.getenv("AI_AGENT_VERBOSE", "1"))
+_SEP = "=" * 60
+
+
+def _v(level, *args, **kwargs):
+    if VERBOSE >= level:
+        cprint(*args, **kwargs)
+
+# Optional Redis-backed balance cache so multi-process deployments (one
+# process per strategy) share a single fetch - set USE_REDIS_CACHE=1.
+# Single-process runs keep the plain in-proc dict below.
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+_redis_client = None
+if REDIS_AVAILABLE and os.getenv("USE_REDIS_CACHE", "0") == "1":
+    _redis_client = redis.Redis(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        decode_responses=True,
+    )
+
+
+def _redis_balance_get(key):
+    global _redis_client
     try:
-        if EXCHANGE in ["ASTER", "HYPERLIQUID"]:
-            if EXCHANGE == "ASTER":
-                balance_dict = n.get_account_balance()
-                balance = balance_dict.get('available', 0) 
-                cprint(f"💰 {EXCHANGE} Available Balance: ${balance:,.2f} USD", "cyan")
-                
-            else:  # HYPERLIQUID
-                address = os.getenv("ACCOUNT_ADDRESS")
-                if not address:
-                    if account is None:
-                        account = n._get_account_from_env()
-                    address = account.address
+        value = _redis_client.get(key)
+        return float(value) if value is not None else None
+    except Exception as e:
+        cprint(f"⚠️ Redis balance cache unavailable ({e}) - falling back to local", "yellow")
+        _redis_client = None
+        return None
 
-                try:
-                    if hasattr(n, 'get_available_balance'):
-                        balance = n.get_available_balance(address)
-                        cprint(f"💰 {EXCHANGE} Available (Free) USDC: ${balance}", "cyan")
-                        
-                        total_val = n.get_account_value(address)
-                        cprint(f"   (Total Equity including positions: ${total_val})", "white")
-                    else:
-                        cprint("⚠️ Using Total Equity (Warning: Checks locked collateral)", "yellow")
-                        balance = n.get_account_value(address)
-                        
-                except Exception as e:
-                    cprint(f"❌ Error getting balance: {e}", "red")
-                    balance = 0
 
-            return float(balance)
-            
-        else:
-            # SOLANA
-            balance = n.get_token_balance_usd(USDC_ADDRESS)
-            return balance
-            
+def _redis_balance_set(key, balance, px):
+    global _redis_client
+    try:
+        _redis_client.set(key, repr(balance), px=px)
+    except Exception as e:
+        cprint(f"⚠️ Redis balance cache unavailable ({e}) - falling back to local", "yellow")
+        _redis_client = None
+
+
+# Balance reads hit a live RPC/HTTP endpoint but get called many times per
+# cycle across symbols - balances move on the order of seconds, so repeated
+# calls within a short TTL window reuse the last fetched value.
+BALANCE_TTL_S = float(os.getenv("BALANCE_TTL_S", "1.0"))
+_balance_cache = {}  # (EXCHANGE, address) -> (balance, expiry_monotonic)
+_balance_lock = threading.Lock()
+_balance_inflight = {}  # (EXCHANGE, address) -> threading.Event
+
+# After a failed fetch, short-circuit to 0.0 for a beat instead of hammering
+# a struggling endpoint - failures are NOT stored in the value cache, so a
+# healthy endpoint is retried as soon as the backoff lapses
+_TRANSIENT_BACKOFF_S = 0.2
+_transient_until = 0.0
+
+
+def invalidate_balance_cache():
+    """Drop cached balances - call right after a fill so reads are fresh"""
+    with _balance_lock:
+        _balance_cache.clear()
+    if _redis_client is not None:
+        try:
+            _redis_client.delete(f"bal:{EXCHANGE}:{_get_balance_address()}")
+        except Exception:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _get_balance_address():
+    """Resolve the account address once - env lookup and, for Hyperliquid,
+    the key derivation in _get_account_from_env are not per-call costs."""
+    address = os.getenv("ACCOUNT_ADDRESS")
+    if not address and EXCHANGE == "HYPERLIQUID":
+        address = n._get_account_from_env().address
+    return address
+
+
+def get_account_balance(account=None):
+    """Get account balance in USD based on exchange type
+
+    Cached for BALANCE_TTL_S and single-flighted: when several threads miss
+    the cache at once (parallel symbol scans), only one hits the exchange
+    and the rest wait for its result instead of firing duplicate RPCs.
+    """
+    global _transient_until
+    cache_key = (EXCHANGE, _get_balance_address())
+
+    while True:
+        with _balance_lock:
+            cached = _balance_cache.get(cache_key)
+            if cached is not None and time.monotonic() < cached[1]:
+                return cached[0]
+            if time.monotonic() < _transient_until:
+                return 0.0
+            event = _balance_inflight.get(cache_key)
+            if event is None:
+                _balance_inflight[cache_key] = threading.Event()
+                break
+        # Another thread is fetching - wait for it, then re-check the cache
+        event.wait(timeout=30)
+
+    try:
+        balance = None
+        if _redis_client is not None:
+            # Another process may have fetched within the TTL already
+            balance = _redis_balance_get(f"bal:{EXCHANGE}:{cache_key[1]}")
+        if balance is None:
+            balance = _fetch_account_balance(account)
+            if _redis_client is not None:
+                _redis_balance_set(f"bal:{EXCHANGE}:{cache_key[1]}", balance,
+                                   px=max(1, int(BALANCE_TTL_S * 1000)))
+        with _balance_lock:
+            _balance_cache[cache_key] = (balance, time.monotonic() + BALANCE_TTL_S)
+        return balance
     except Exception as e:
         cprint(f"❌ Error getting account balance: {e}", "red")
-        return 0
+        with _balance_lock:
+            _transient_until = time.monotonic() + _TRANSIENT_BACKOFF_S
+        return 0.0
+    finally:
+        with _balance_lock:
+            _balance_inflight.pop(cache_key).set()
+
+
+_prefetch_pool = None
+
+
+def prefetch_account_balance(account=None):
+    """Kick off a balance fetch in the background and return its Future.
+
+    Call at cycle start so the round-trip overlaps with OHLCV collection
+    and position scans - by the time the cycle needs the number, the
+    synchronous get_account_balance() resolves from the warm cache. The
+    single-flight logic means a concurrent direct caller joins this fetch
+    rather than duplicating it.
+    """
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bal-prefetch")
+    return _prefetch_pool.submit(get_account_balance, account)
+
+
+def _fetch_balance_aster(account=None):
+    balance_dict = n.get_account_balance()
+    balance = balance_dict.get('available', 0)
+    if LOG_POSITION_CALC:
+        cprint(f"💰 ASTER Available Balance: ${balance:,.2f} USD", "cyan")
+    return float(balance)
+
+
+def _fetch_balance_hyperliquid(account=None):
+    # ACCOUNT_ADDRESS env still wins (memoized); an explicit account is only
+    # consulted when the env/derived address is unavailable
+    address = _get_balance_address()
+    if not address and account is not None:
+        address = account.address
+
+    # No inner try here - with the helpers pre-resolved the only failures
+    # left are real network/SDK errors, which the outer handler in
+    # _fetch_account_balance reports instead of silently mapping to 0
+    if _get_available_balance is not None:
+        balance = _get_available_balance(address)
+        if LOG_POSITION_CALC:
+            cprint(f"💰 HYPERLIQUID Available (Free) USDC: ${balance}", "cyan")
+            total_val = _get_account_value(address)
+            cprint(f"   (Total Equity including positions: ${total_val})", "white")
+    else:
+        cprint("⚠️ Using Total Equity (Warning: Checks locked collateral)", "yellow")
+        balance = _get_account_value(address)
 
+    # SDK already hands back a float on current versions - only coerce the
+    # str/Decimal case so the common path skips the redundant float() call
+    return balance if type(balance) is float else float(balance)
 
-def calculate_position_size(account_balance):
-    """Calculate position size based on account balance and MAX_POSITION_PERCENTAGE"""
-    if EXCHANGE in ["ASTER", "HYPERLIQUID"]:
-        margin_to_use = account_balance * (MAX_POSITION_PERCENTAGE / 100)
-        notional_position = margin_to_use * LEVERAGE
 
-        cprint(f"   📊 Position Calculation ({EXCHANGE}):", "yellow", attrs=['bold'])
-        cprint(f"   💵 Account Balance: ${account_balance:,.2f}", "white")
-        cprint(f"   📈 Max Position %: {MAX_POSITION_PERCENTAGE}%", "white")
-        cprint(f"   💰 Margin to Use: ${margin_to_use:,.2f}", "green", attrs=['bold'])
-        cprint(f"   ⚡ Leverage: {LEVERAGE}x", "white")
-        cprint(f"   💎 Notional Position: ${notional_position:,.2f}", "cyan", attrs=['bold'])
+def _fetch_balance_solana(account=None):
+    balance = n.get_token_balance_usd(USDC_ADDRESS)
+    return balance if type(balance) is float else float(balance)
+
 
-        return notional_position
+def get_account_balances(subjects, max_workers=4):
+    """Fetch balances for several subjects in one go instead of serial loops.
+
+    Subjects are addresses for ASTER/HYPERLIQUID or token mints for SOLANA.
+    Returns {subject: balance} with 0 for subjects whose fetch failed, so a
+    partial outage doesn't sink the whole batch.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if EXCHANGE_ID == 0:
+        fetch_one = n.get_token_balance_usd
+    elif _get_available_balance is not None:
+        fetch_one = _get_available_balance
     else:
-        # For Solana: No leverage, direct position size
-        position_size = account_balance * (MAX_POSITION_PERCENTAGE / 100)
+        fetch_one = _get_account_value
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {subject: pool.submit(fetch_one, subject) for subject in subjects}
+        for subject, future in futures.items():
+            try:
+                results[subject] = float(future.result())
+            except Exception as e:
+                cprint(f"❌ Balance fetch failed for {subject}: {e}", "red")
+                results[subject] = 0.0
+    return results
+
+
+# The exchange is fixed for the process lifetime, so the round-trip behind
+# get_account_balance is bound directly - no dict lookup or branch per call.
+# Raises on failure; the wrapper reports it and arms the transient backoff
+# rather than caching a bogus 0 balance for the full TTL.
+_fetch_account_balance = {
+    0: _fetch_balance_solana,
+    1: _fetch_balance_aster,
+    2: _fetch_balance_hyperliquid,
+}[EXCHANGE_ID]
+
+
+# Sizing constants folded once at import - the hot path is then a single
+# multiply per call instead of a division plus global lookups
+_POSITION_FRACTION = MAX_POSITION_PERCENTAGE / 100.0
+_NOTIONAL_MULT = _POSITION_FRACTION * LEVERAGE
+
 
-        cprint(f"   📊 Position Calculation (SOLANA):", "yellow", attrs=['bold'])
-        cprint(f"   💵 USDC Balance: ${account_balance:,.2f}", "white")
-        cprint(f"   📈 Max Position %: {MAX_POSITION_PERCENTAGE}%", "white")
+def reload_position_constants():
+    """Refold sizing constants after MAX_POSITION_PERCENTAGE/LEVERAGE change"""
+    global _POSITION_FRACTION, _NOTIONAL_MULT
+    _POSITION_FRACTION = MAX_POSITION_PERCENTAGE / 100.0
+    _NOTIONAL_MULT = _POSITION_FRACTION * LEVERAGE
+
+
+def _calc_position_size_perp(account_balance):
+    """Position size with leverage for ASTER/HYPERLIQUID"""
+    notional_position = account_balance * _NOTIONAL_MULT
+
+    if LOG_POSITION_CALC:
+        _log_position_calc(account_balance, account_balance * _POSITION_FRACTION,
+                           notional_position)
+
+    return notional_position
+
+
+def _calc_position_size_spot(account_balance):
+    """Direct position size for Solana - no leverage"""
+    position_size = account_balance * _POSITION_FRACTION
+
+    if LOG_POSITION_CALC:
+        _log_position_calc(account_balance, None, position_size)
+
+    return position_size
+
+
+# Specialized at import like _fetch_account_balance - callers keep the
+# calculate_position_size name, the IS_PERP branch is gone from the call path
+calculate_position_size = _calc_position_size_perp if IS_PERP else _calc_position_size_spot
+
+
+def _log_position_calc(account_balance, margin_to_use, position_size):
+    """Verbose sizing breakdown - only formatted when LOG_POSITION_CALC is on"""
+    cprint(f"   📊 Position Calculation ({EXCHANGE}):", "yellow", attrs=['bold'])
+    cprint(f"   💵 Account Balance: ${account_balance:,.2f}", "white")
+    cprint(f"   📈 Max Position %: {MAX_POSITION_PERCENTAGE}%", "white")
+    if margin_to_use is not None:
+        cprint(f"   💰 Margin to Use: ${margin_to_use:,.2f}", "green", attrs=['bold'])
+        cprint(f"   ⚡ Leverage: {LEVERAGE}x", "white")
+        cprint(f"   💎 Notional Position: ${position_size:,.2f}", "cyan", attrs=['bold'])
+    else:
         cprint(f"   💎 Position Size: ${position_size:,.2f}", "cyan", attrs=['bold'])
 
-        return position_size
+
+@lru_cache(maxsize=8)
+def _build_swarm_custom_models(cfg_key):
+    """Pure mapping from ((provider, model), ...) to SwarmAgent's format -
+    memoized so hot-reloads and repeat agent constructions skip the work."""
+    return {
+        f"{provider}_{i}": (True, provider, model_name)
+        for i, (provider, model_name) in enumerate(cfg_key, 1)
+    }
+
+
+# Config keys whose model list was already printed - rebuilds stay quiet
+_swarm_cfg_logged = set()
+
+
+def _summarize_market_data(df):
+    """Compact summary stats for the swarm prompt - a few hundred bytes
+    instead of a raw multi-hundred-bar dump, computed vectorized once."""
+    try:
+        cols = {str(c).lower(): c for c in df.columns}
+        close = df[cols["close"]].astype(float)
+        high = df[cols.get("high", cols["close"])].astype(float)
+        low = df[cols.get("low", cols["close"])].astype(float)
+        prev_close = close.shift(1)
+
+        true_range = pd.concat(
+            [high - low, (high - prev_close).abs(), (low - prev_close).abs()],
+            axis=1,
+        ).max(axis=1)
+
+        stats = {
+            "last_close": round(float(close.iloc[-1]), 6),
+            "sma20": round(float(close.rolling(20).mean().iloc[-1]), 6) if len(close) >= 20 else None,
+            "sma50": round(float(close.rolling(50).mean().iloc[-1]), 6) if len(close) >= 50 else None,
+            "atr14": round(float(true_range.rolling(14).mean().iloc[-1]), 6) if len(close) >= 15 else None,
+            "realized_vol_pct": round(float(close.pct_change().std() * 100), 4),
+            "window_high": round(float(high.max()), 6),
+            "window_low": round(float(low.min()), 6),
+        }
+        return json.dumps(stats, separators=(",", ":"))
+    except Exception as e:
+        cprint(f"⚠️ Could not summarize market data: {e}", "yellow")
+        return "{}"
+
+
+def _format_recent_bars(df, n, head=False):
+    """Format the last (or first) n bars without pandas' generic formatter
+
+    DataFrame.to_string() walks every cell through the object formatting
+    path and allocates a large intermediate string; iterating the slice as
+    tuples and joining once is 10-30x cheaper and produces fewer prompt
+    bytes. Falls back to to_string() for the lightweight shim.
+    """
+    if not hasattr(df, "iloc"):
+        return (df.head(n) if head else df.tail(n)).to_string()
+
+    rows = df.iloc[:n] if head else df.iloc[-n:]
+    cols = list(rows.columns)
+    lines = ["timestamp " + " ".join(str(c) for c in cols)]
+    for row in rows.itertuples(index=True, name=None):
+        vals = " ".join(
+            f"{v:.4f}" if isinstance(v, float) else str(v) for v in row[1:]
+        )
+        lines.append(f"{row[0]} {vals}")
+    return "\n".join(lines)
 
 
 # ============================================================================
@@ -613,8 +1009,14 @@ class TradingAgent:
         else:
             self.symbols = MONITORED_TOKENS
 
+        # O(1) membership for the per-cycle `in self.symbols` checks
+        # (self.symbols stays a list for ordering)
+        self._symbol_set = frozenset(self.symbols)
+
         self.account = None
         if EXCHANGE == "HYPERLIQUID":
+            from eth_account import Account
+
             cprint("🔑 Initializing Hyperliquid Account...", "cyan")
             try:
                 # Standardized key lookup
@@ -635,8 +1037,14 @@ class TradingAgent:
                 cprint(f"❌ Error loading key: {e}", "red")
                 sys.exit(1)
 
+        # Heavy imports deferred to here - only a live agent needs them
+        from src.models import model_factory
+        from src.agents.strategy_agent import StrategyAgent
+
         # Check if using swarm mode or single model
         if self.use_swarm_mode:
+            from src.agents.swarm_agent import SwarmAgent
+
             # Convert user's swarm_models format to SwarmAgent's format
             custom_models = self._build_swarm_models_config()
             num_models = len(custom_models) if custom_models else 6
@@ -655,10 +1063,10 @@ class TradingAgent:
                 self.swarm = SwarmAgent()
                 cprint("✅ Swarm mode initialized with default AI models!", "green")
 
-            cprint("💼 Initializing fast model for portfolio calculations...", "cyan")
-            self.model = model_factory.get_model(self.ai_provider, self.ai_model_name)
-            if self.model:
-                cprint(f"✅ Allocation model ready: {self.model.model_name}", "green")
+            # Allocation model built lazily on first chat_with_ai call -
+            # swarm recommendations don't need it, so cold-start skips
+            # loading a second provider SDK
+            self.model = None
         else:
             cprint(f"\n⚙️ Initializing Trading Agent with {self.ai_provider} model...", "cyan")
             self.model = model_factory.get_model(self.ai_provider, self.ai_model_name)
@@ -673,9 +1081,13 @@ class TradingAgent:
 
             cprint(f"✅ Using model: {self.model.model_name}", "green")
 
-        self.recommendations_df = pd.DataFrame(
-            columns=["token", "action", "confidence", "reasoning"]
-        )
+        # Recommendations accumulate in a plain list of dicts - per-row
+        # pd.concat re-copied the whole frame on every append (O(N^2) over
+        # a cycle). recommendations_df builds the frame lazily on read.
+        self._rec_rows = []
+        self._rec_version = 0
+        self._rec_df_cache = (-1, None)
+        self._rec_lock = threading.Lock()
 
         # --- StrategyAgent (non-executing) ---
         try:
@@ -685,13 +1097,27 @@ class TradingAgent:
             self.strategy_agent = None
             cprint(f"⚠️ StrategyAgent failed to initialize: {e}", "yellow")
 
-        # Simple in-memory cache for enriched strategy contexts per token
-        # token -> {'data': ..., 'expires_at': datetime}
-        self._strategy_context_cache = {}
+        # Enriched strategy contexts per token - TTLCache expires on
+        # monotonic time internally, so hits skip the datetime comparisons
+        # the old hand-rolled dict needed
         self.STRATEGY_CONTEXT_TTL = 120  # seconds (tune for your timeframe)
+        self._strategy_context_cache = TTLCache(maxsize=256, ttl=self.STRATEGY_CONTEXT_TTL)
 
+        # Exact-match LLM response cache: identical (model, temperature,
+        # prompts) within the TTL skip the provider round-trip entirely.
+        # Only low-temperature calls are cached - hot sampling is meant to
+        # vary between calls
+        self._llm_cache = TTLCache(maxsize=4096, ttl=self.STRATEGY_CONTEXT_TTL)
 
+        # Formatted strategy text memo keyed by context object identity -
+        # StrategyAgent can hand several tokens the same context object
+        self._strategy_text_memo = {}
 
+        # Warm the jitted indicator kernels now so the first trading cycle
+        # doesn't pay the numba compile (no-op for exchanges without them)
+        warmup = getattr(n, 'warmup_indicator_kernels', None)
+        if warmup:
+            warmup()
 
 
         # Show which tokens will be analyzed
@@ -740,24 +1166,70 @@ class TradingAgent:
         if not self.swarm_models_config:
             return None
 
-        custom_models = {}
-        for i, model_config in enumerate(self.swarm_models_config, 1):
-            provider = model_config.get('provider', 'openrouter')
-            model_name = model_config.get('model', 'nex-agi/deepseek-v3.1-nex-n1:free')
-
-            # Create unique key for each model (e.g., "gemini_1", "openai_2")
-            model_key = f"{provider}_{i}"
+        cfg_key = tuple(
+            (c.get('provider', 'openrouter'),
+             c.get('model', 'nex-agi/deepseek-v3.1-nex-n1:free'))
+            for c in self.swarm_models_config
+        )
 
-            # SwarmAgent expects: (enabled, provider_type, model_name)
-            custom_models[model_key] = (True, provider, model_name)
+        # SwarmAgent expects: {"gemini_1": (enabled, provider_type, model_name)}
+        custom_models = _build_swarm_custom_models(cfg_key)
 
-            cprint(f"   📦 Swarm Model {i}: {provider}/{model_name}", "cyan")
+        if cfg_key not in _swarm_cfg_logged:
+            _swarm_cfg_logged.add(cfg_key)
+            for i, (provider, model_name) in enumerate(cfg_key, 1):
+                cprint(f"   📦 Swarm Model {i}: {provider}/{model_name}", "cyan")
 
         return custom_models if custom_models else None
 
+    @property
+    def recommendations_df(self):
+        """DataFrame view over this cycle's recommendation rows
+
+        Built lazily from _rec_rows and cached until the next append, so
+        readers (dashboard, summary prints) get a real DataFrame without
+        the analysis loop paying concat costs per row.
+        """
+        version, df = self._rec_df_cache
+        if version != self._rec_version:
+            df = pd.DataFrame(
+                self._rec_rows,
+                columns=["token", "action", "confidence", "reasoning"],
+            )
+            self._rec_df_cache = (self._rec_version, df)
+        return df
+
+    def _append_recommendation(self, token, action, confidence, reasoning):
+        # Lock keeps the version bump consistent when analyses run on the
+        # ANALYSIS_MAX_WORKERS thread pool
+        with self._rec_lock:
+            self._rec_rows.append({
+                "token": token,
+                "action": action,
+                "confidence": confidence,
+                "reasoning": reasoning,
+            })
+            self._rec_version += 1
+
     def chat_with_ai(self, system_prompt, user_content):
         """Send prompt to AI model via model factory"""
+        cache_key = None
+        if self.ai_temperature <= 0.3:
+            cache_key = hashlib.sha256(
+                f"{self.ai_model_name}\x00{self.ai_temperature}\x00"
+                f"{system_prompt}\x00{user_content}".encode()
+            ).hexdigest()
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
+            if self.model is None:
+                from src.models import model_factory
+                cprint("💼 Initializing fast model for portfolio calculations...", "cyan")
+                self.model = model_factory.get_model(self.ai_provider, self.ai_model_name)
+                cprint(f"✅ Allocation model ready: {self.model.model_name}", "green")
+
             response = self.model.generate_response(
                 system_prompt=system_prompt,
                 user_content=user_content,
@@ -766,8 +1238,13 @@ class TradingAgent:
             )
 
             if hasattr(response, "content"):
-                return response.content
-            return str(response)
+                content = response.content
+            else:
+                content = str(response)
+
+            if cache_key is not None and content:
+                self._llm_cache[cache_key] = content
+            return content
 
         except Exception as e:
             error_str = str(e).lower()
@@ -809,10 +1286,10 @@ class TradingAgent:
                 cprint(f"🕐 Timeframe: {self.timeframe}", "yellow")
 
                 cprint("\n📈 First 5 Bars (OHLCV):", "cyan")
-                print(market_data.head().to_string())
+                print(_format_recent_bars(market_data, 5, head=True))
 
                 cprint("\n📉 Last 3 Bars (Most Recent):", "cyan")
-                print(market_data.tail(3).to_string())
+                print(_format_recent_bars(market_data, 3))
 
                 formatted = f"""
 TOKEN: {token}
@@ -820,18 +1297,18 @@ TIMEFRAME: {self.timeframe} bars
 TOTAL BARS: {len(market_data)}
 DATE RANGE: {market_data.index[0]} to {market_data.index[-1]}
 
-RECENT PRICE ACTION (Last 10 bars):
-{market_data.tail(10).to_string()}
+RECENT PRICE ACTION (Last 20 bars):
+{_format_recent_bars(market_data, 20)}
 
-FULL DATASET:
-{market_data.to_string()}
+SUMMARY STATISTICS (full window):
+{_summarize_market_data(market_data)}
 """
             else:
                 cprint(f"⚠️ Market data is not a DataFrame: {type(market_data)}", "yellow")
                 formatted = f"TOKEN: {token}\nMARKET DATA:\n{str(market_data)}"
 
             if isinstance(market_data, dict) and "strategy_signals" in market_data:
-                formatted += f"\n\nSTRATEGY SIGNALS:\n{json.dumps(market_data['strategy_signals'], indent=2)}"
+                formatted += f"\n\nSTRATEGY SIGNALS:\n{_dumps_indent(market_data['strategy_signals'])}"
 
             cprint("\n✅ Market data formatted and ready for analysis!\n", "green")
             return formatted
@@ -852,8 +1329,9 @@ FULL DATASET:
         5. Clear frontend logging: "Swarm -> BUY | 62% sure"
         """
         try:
-            # Track votes with confidence scores
-            votes = {"BUY": [], "SELL": [], "NOTHING": []}  # Lists of confidence scores
+            # Single-pass tally into fixed slots (BUY/SELL/NOTHING)
+            counts = [0, 0, 0]
+            conf_sums = [0, 0, 0]
             model_votes = []  # For detailed logging
             model_index = 1
 
@@ -867,13 +1345,14 @@ FULL DATASET:
                     continue
 
                 response_text = data["response"].strip() if data["response"] else ""
-                response_upper = response_text.upper()
 
                 # Parse vote AND confidence with new format
-                action, confidence = self._parse_vote_from_response(response_upper)
+                action, confidence = self._parse_vote_from_response(response_text)
 
-                # Store confidence score for this action
-                votes[action].append(confidence)
+                # Accumulate count and confidence for this action
+                slot = _SWARM_ACT_IDX[action]
+                counts[slot] += 1
+                conf_sums[slot] += confidence
 
                 # Format vote display
                 vote_display = f"Model {model_index} - {action} | {confidence}%"
@@ -890,32 +1369,28 @@ FULL DATASET:
                 model_index += 1
 
             # Count total valid votes
-            total_votes = sum(len(v) for v in votes.values())
+            total_votes = counts[0] + counts[1] + counts[2]
             if total_votes == 0:
                 cprint("❌ No valid responses from swarm - defaulting to NOTHING", "red")
                 add_console_log("Swarm -> NOTHING | 0% (no responses)", "warning")
                 return "NOTHING", 0, "No valid responses from swarm"
 
-            # Calculate vote counts and average confidence per action
-            vote_counts = {action: len(confs) for action, confs in votes.items()}
-            avg_confidences = {}
-            for action, confs in votes.items():
-                if confs:
-                    avg_confidences[action] = int(sum(confs) / len(confs))
-                else:
-                    avg_confidences[action] = 0
-
-            # Find majority action
-            majority_action = max(vote_counts, key=vote_counts.get)
-            majority_count = vote_counts[majority_action]
+            # Per-action counts and average confidence straight off the slots
+            vote_counts = dict(zip(_SWARM_ACTS, counts))
+            avg_confidences = {
+                action: (conf_sums[i] // counts[i] if counts[i] else 0)
+                for i, action in enumerate(_SWARM_ACTS)
+            }
 
-            # Check for ties - look at top 2 vote counts
-            sorted_counts = sorted(vote_counts.values(), reverse=True)
-            has_tie = len(sorted_counts) >= 2 and sorted_counts[0] == sorted_counts[1] and sorted_counts[0] > 0
+            # Majority and tie straight off the three slots - no keyed max,
+            # sorted() allocation, or dict re-scan
+            majority_count = max(counts)
+            majority_action = _SWARM_ACTS[counts.index(majority_count)]
+            has_tie = majority_count > 0 and counts.count(majority_count) > 1
 
             if has_tie:
                 # Find which actions are tied
-                tied_actions = [a for a, c in vote_counts.items() if c == majority_count]
+                tied_actions = [_SWARM_ACTS[i] for i, c in enumerate(counts) if c == majority_count]
                 tie_avg_confidence = int(sum(avg_confidences[a] for a in tied_actions) / len(tied_actions))
 
                 cprint(
@@ -927,16 +1402,13 @@ FULL DATASET:
                 # Log to frontend with TIED status
                 add_console_log(f"Swarm -> TIED | {tie_avg_confidence}% sure", "warning")
 
-                reasoning = f"🌊 Swarm Consensus: TIED ({total_votes} models voted)\n\n"
-                reasoning += "Vote Breakdown:\n"
-                for action in ["BUY", "SELL", "NOTHING"]:
-                    count = vote_counts[action]
-                    avg = avg_confidences[action]
-                    reasoning += f"   {action}: {count} votes (avg {avg}% confidence)\n"
-                reasoning += f"\n⚠️ TIE between: {', '.join(tied_actions)}\n"
-                reasoning += "   → Conservative approach: No action taken\n\n"
-                reasoning += "Individual Votes:\n"
-                reasoning += "\n".join(f"   {vote}" for vote in model_votes)
+                reasoning = self._format_swarm_reasoning(
+                    f"🌊 Swarm Consensus: TIED ({total_votes} models voted)",
+                    vote_counts, avg_confidences,
+                    (f"⚠️ TIE between: {', '.join(tied_actions)}",
+                     "   → Conservative approach: No action taken"),
+                    model_votes,
+                )
 
                 return "NOTHING", tie_avg_confidence, reasoning
 
@@ -955,16 +1427,22 @@ FULL DATASET:
 
                 add_console_log(f"Swarm -> NOTHING | {final_confidence}% (low confidence)", "warning")
 
-                reasoning = f"🌊 Swarm Consensus: LOW CONFIDENCE ({total_votes} models voted)\n\n"
-                reasoning += "Vote Breakdown:\n"
-                for action in ["BUY", "SELL", "NOTHING"]:
-                    count = vote_counts[action]
-                    avg = avg_confidences[action]
-                    reasoning += f"   {action}: {count} votes (avg {avg}% confidence)\n"
-                reasoning += f"\n⚠️ Confidence {final_confidence}% below {MIN_SWARM_CONFIDENCE}% threshold\n"
-                reasoning += f"   Original: {majority_action} | Downgraded to: NOTHING\n\n"
-                reasoning += "Individual Votes:\n"
-                reasoning += "\n".join(f"   {vote}" for vote in model_votes)
+                # This exit fires constantly in noisy markets and the result
+                # isn't acted on, so skip the full breakdown unless asked for
+                if SWARM_VERBOSE_REASONING:
+                    reasoning = self._format_swarm_reasoning(
+                        f"🌊 Swarm Consensus: LOW CONFIDENCE ({total_votes} models voted)",
+                        vote_counts, avg_confidences,
+                        (f"⚠️ Confidence {final_confidence}% below {MIN_SWARM_CONFIDENCE}% threshold",
+                         f"   Original: {majority_action} | Downgraded to: NOTHING"),
+                        model_votes,
+                    )
+                else:
+                    reasoning = (
+                        f"Low confidence: {majority_action} at {final_confidence}% "
+                        f"(below {MIN_SWARM_CONFIDENCE}% threshold) downgraded to NOTHING "
+                        f"({majority_count}/{total_votes} votes)"
+                    )
 
                 return "NOTHING", final_confidence, reasoning
 
@@ -980,16 +1458,13 @@ FULL DATASET:
             # Log to frontend with clear format
             add_console_log(f"Swarm -> {majority_action} | {final_confidence}% sure", "trade")
 
-            reasoning = f"🌊 Swarm Consensus: {majority_action} ({total_votes} models voted)\n\n"
-            reasoning += "Vote Breakdown:\n"
-            for action in ["BUY", "SELL", "NOTHING"]:
-                count = vote_counts[action]
-                avg = avg_confidences[action]
-                reasoning += f"   {action}: {count} votes (avg {avg}% confidence)\n"
-            reasoning += f"\n{action_emoji} Final Decision: {majority_action} | {final_confidence}% confident\n"
-            reasoning += f"   ({majority_count}/{total_votes} models agreed = {vote_percentage}% consensus)\n\n"
-            reasoning += "Individual Votes:\n"
-            reasoning += "\n".join(f"   {vote}" for vote in model_votes)
+            reasoning = self._format_swarm_reasoning(
+                f"🌊 Swarm Consensus: {majority_action} ({total_votes} models voted)",
+                vote_counts, avg_confidences,
+                (f"{action_emoji} Final Decision: {majority_action} | {final_confidence}% confident",
+                 f"   ({majority_count}/{total_votes} models agreed = {vote_percentage}% consensus)"),
+                model_votes,
+            )
 
             return majority_action, final_confidence, reasoning
 
@@ -998,7 +1473,27 @@ FULL DATASET:
             add_console_log(f"Swarm -> ERROR | 0%", "error")
             return "NOTHING", 0, f"Error calculating consensus: {str(e)}"
 
-    def _parse_vote_from_response(self, response_upper):
+    def _format_swarm_reasoning(self, headline, vote_counts, avg_confidences,
+                                verdict_lines, model_votes):
+        """Assemble a consensus reasoning block in one join
+
+        All three consensus outcomes (tie, low confidence, majority) share
+        this shape; building a parts list and joining once avoids the
+        quadratic churn of repeated str concatenation.
+        """
+        parts = [headline, "", "Vote Breakdown:"]
+        parts.extend(
+            f"   {action}: {vote_counts[action]} votes (avg {avg_confidences[action]}% confidence)"
+            for action in _SWARM_ACTS
+        )
+        parts.append("")
+        parts.extend(verdict_lines)
+        parts.append("")
+        parts.append("Individual Votes:")
+        parts.extend(f"   {vote}" for vote in model_votes)
+        return "\n".join(parts)
+
+    def _parse_vote_from_response(self, response_text):
         """
         Parse a vote from the model response with strict matching.
         Now extracts both action AND confidence score.
@@ -1010,48 +1505,30 @@ FULL DATASET:
             - action: "BUY", "SELL", or "NOTHING"
             - confidence: 0-100 (defaults to 50 if not found)
         """
-        # Clean the response (remove extra whitespace, newlines)
-        response_clean = response_upper.strip().split('\n')[0].strip()
-
-        # Default confidence if not found
+        # Fast path: one case-insensitive pass grabs action and confidence
+        match = _VOTE_RE.match(response_text)
+        if match:
+            conf = match.group("conf")
+            confidence = min(100, max(0, int(conf))) if conf else 50
+            return _ACTION_MAP.get(match.group("act")[0].upper(), "NOTHING"), confidence
+
+        # Fallback for responses that don't lead with an action keyword:
+        # scan the first line only (rare, so the .upper() copy is fine here)
+        response_clean = response_text.split('\n', 1)[0].upper()
         confidence = 50
 
-        # Try to parse "ACTION | XX%" format
         if "|" in response_clean:
-            parts = response_clean.split("|")
-            action_part = parts[0].strip()
-            confidence_part = parts[1].strip() if len(parts) > 1 else ""
-
-            # Extract confidence number
-            confidence_match = re.search(r'(\d+)', confidence_part)
+            response_clean, _, confidence_part = response_clean.partition("|")
+            confidence_match = _CONF_RE.search(confidence_part)
             if confidence_match:
                 confidence = min(100, max(0, int(confidence_match.group(1))))
 
-            # Parse action from the first part
-            response_clean = action_part
-
-        # Parse action with priority matching
-        action = "NOTHING"
-
-        # Priority 1: Exact match
-        if response_clean in ["BUY"]:
-            action = "BUY"
-        elif response_clean in ["SELL"]:
-            action = "SELL"
-        elif response_clean in ["DO NOTHING", "NOTHING", "HOLD", "WAIT"]:
-            action = "NOTHING"
-        # Priority 2: Starts with action word
-        elif response_clean.startswith("BUY"):
-            action = "BUY"
-        elif response_clean.startswith("SELL"):
-            action = "SELL"
-        elif response_clean.startswith("DO NOTHING") or response_clean.startswith("NOTHING"):
-            action = "NOTHING"
-        # Priority 3: Contains action word (fallback)
-        elif "SELL" in response_clean:
+        if "SELL" in response_clean:
             action = "SELL"
         elif "BUY" in response_clean:
             action = "BUY"
+        else:
+            action = "NOTHING"
 
         return action, confidence
 
@@ -1062,9 +1539,9 @@ FULL DATASET:
         CRITICAL FIX: Now iterates through ALL subpositions, not just the first one.
         This ensures we detect multiple positions for the same symbol.
         """
-        cprint("\n" + "=" * 60, "cyan")
+        _v(1, "\n" + _SEP, "cyan")
         cprint("📊 FETCHING ALL OPEN POSITIONS", "white", "on_blue", attrs=["bold"])
-        cprint("=" * 60, "cyan")
+        _v(1, _SEP, "cyan")
 
         all_positions = {}
         exchange_positions = {}  # For syncing with tracker
@@ -1072,14 +1549,31 @@ FULL DATASET:
         # This ensures user-configured symbols from settings are respected
         check_tokens = self.symbols
         total_position_count = 0
+        position_lines = []
+
+        # Fetch every symbol concurrently - each get_position is a blocking
+        # exchange round-trip, so serial scans cost N RTTs per cycle. The
+        # processing/printing below stays single-threaded in symbol order.
+        from concurrent.futures import ThreadPoolExecutor
+
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=min(16, max(1, len(check_tokens)))) as pool:
+            futures = {s: pool.submit(_get_position, s, self.account) for s in check_tokens}
+            for symbol, future in futures.items():
+                try:
+                    fetched[symbol] = future.result()
+                except Exception as e:
+                    fetched[symbol] = e
 
         for symbol in check_tokens:
             try:
+                result = fetched[symbol]
+                if isinstance(result, Exception):
+                    raise result
+
                 # get_position returns: positions (list), im_in_pos, pos_size, pos_sym, entry_px, pnl_perc, is_long
                 # The 'positions' list contains ALL subpositions for this symbol
-                positions_list, im_in_pos, _, _, _, _, _ = n.get_position(
-                    symbol, self.account
-                )
+                positions_list, im_in_pos, _, _, _, _, _ = result
 
                 if im_in_pos and positions_list:
                     # CRITICAL FIX: Iterate through ALL positions, not just the first one
@@ -1121,19 +1615,24 @@ FULL DATASET:
                         all_positions[symbol].append(position_data)
                         total_position_count += 1
 
-                        # Include age in display
+                        # Buffer the display line - one stdout write after the
+                        # loop instead of a syscall per position
                         age_str = f"{age_hours:.1f}h" if age_hours > 0 else "NEW"
-                        cprint(
+                        position_lines.append(colored(
                             f"   {symbol:<10} | {position_data['side']:<10} | "
                             f"Size: {pos_size:>10.4f} | Entry: ${entry_px:>10.2f} | "
                             f"PnL: {pnl_perc:>6.2f}% | Age: {age_str}",
                             "cyan",
-                        )
+                        ) + "\n")
 
             except Exception as e:
                 cprint(f"   ❌ Error fetching {symbol}: {e}", "red")
                 continue
 
+        if position_lines:
+            sys.stdout.write("".join(position_lines))
+            sys.stdout.flush()
+
         # Show total count (including subpositions)
         cprint(f"\n   📊 Total positions detected: {total_position_count}", "yellow", attrs=["bold"])
 
@@ -1148,7 +1647,7 @@ FULL DATASET:
         if not all_positions:
             cprint("   ℹ️  No open positions found", "yellow")
 
-        cprint("=" * 60 + "\n", "cyan")
+        _v(1, _SEP + "\n", "cyan")
         return all_positions
 
     def validate_close_decision(self, symbol, pnl_percent, age_hours, ai_confidence, ai_decision="CLOSE"):
@@ -1233,10 +1732,10 @@ FULL DATASET:
         if not positions_data:
             return {}
 
-        cprint("\n" + "=" * 60, "yellow")
+        _v(1, "\n" + _SEP, "yellow")
         cprint("📊 AI ANALYZING OPEN POSITIONS", "white", "on_magenta", attrs=["bold"])
         add_console_log("Analyzing Open Positions", "info")
-        cprint("=" * 60, "yellow")
+        _v(1, _SEP, "yellow")
 
         # CRITICAL: Check TP/SL thresholds FIRST - force close regardless of AI analysis
         validated_decisions = {}
@@ -1289,58 +1788,46 @@ FULL DATASET:
             if symbol in market_data:
                 df = market_data[symbol]
                 if not df.empty:
-                    latest = df.iloc[-1]
-
                     # Robustly detect the correct close column
-                    if "Close" in df.columns:
-                        current_price = latest["Close"]
-                    elif "close" in df.columns:
-                        current_price = latest["close"]
-                    elif "close_price" in df.columns:
-                        current_price = latest["close_price"]
-                    elif "c" in df.columns:
-                        current_price = latest["c"]
-                    elif "price" in df.columns:
-                        current_price = latest["price"]
-                    else:
+                    close_col = next((c for c in _CLOSE_COL_CANDIDATES if c in df.columns), None)
+                    if close_col is None:
                         cprint(f"⚠️ No close price column found for {symbol}, skipping...", "yellow")
                         continue
 
+                    # One ndarray row slice instead of an iloc Series plus a
+                    # label lookup per indicator
+                    ind_cols = [c for c in ("MA20", "MA40", "RSI") if c in df.columns]
+                    row = df[[close_col] + ind_cols].to_numpy()[-1]
+                    vals = dict(zip(ind_cols, row[1:]))
+
+                    current_price = float(row[0])
+                    ma20 = float(vals.get("MA20", 0))
                     market_summary[symbol] = {
                         "current_price": current_price,
-                        "ma20": latest.get("MA20", 0),
-                        "ma40": latest.get("MA40", 0),
-                        "rsi": latest.get("RSI", 0),
-                        "trend": "Bullish" if current_price > latest.get("MA20", 0) else "Bearish",
+                        "ma20": ma20,
+                        "ma40": float(vals.get("MA40", 0)),
+                        "rsi": float(vals.get("RSI", 0)),
+                        "trend": "Bullish" if current_price > ma20 else "Bearish",
                     }
 
         # Only analyze positions that weren't force-closed by TP/SL
         if position_summary:
-            user_prompt = f"""Analyze these open positions:
-
-POSITIONS:
-{json.dumps(position_summary, indent=2)}
-
-CURRENT MARKET CONDITIONS:
-{json.dumps(market_summary, indent=2)}
-
-For each position, decide KEEP or CLOSE with reasoning.
-Return ONLY valid JSON with the following structure:
-{{
-  "SYMBOL": {{
-     "action": "KEEP" or "CLOSE",
-     "reasoning": "short explanation"
-  }}
-}}"""
+            user_prompt = "".join((
+                _POSITION_PROMPT_PREFIX,
+                _dumps_indent(position_summary),
+                _POSITION_PROMPT_MIDDLE,
+                _dumps_indent(market_summary),
+                _POSITION_PROMPT_SUFFIX,
+            ))
 
             try:
                 response = self.chat_with_ai(POSITION_ANALYSIS_PROMPT, user_prompt)
 
-                # Strip Markdown fences if model wrapped response in code blocks
-                if "```json" in response:
-                    response = response.split("```json")[1].split("```")[0]
-                elif "```" in response:
-                    response = response.split("```")[1].split("```")[0]
+                # Strip Markdown fences if model wrapped response in code
+                # blocks - one regex pass instead of in + split scans
+                fence_match = _FENCE_RE.search(response)
+                if fence_match:
+                    response = fence_match.group(1)
 
                 # Try safe JSON extraction first
                 decisions = extract_json_from_text(response)
@@ -1348,17 +1835,21 @@ Return ONLY valid JSON with the following structure:
                     cprint("⚠️ AI response not valid JSON. Attempting text fallback...", "yellow")
 
                     text = response.lower()
+                    # The keyword verdicts don't vary per symbol - scan the
+                    # response once instead of inside the loop
+                    has_close = "close" in text or "sell" in text
+                    has_keep = "keep" in text or "hold" in text or "open" in text
                     decisions = {}
                     for symbol in position_summary:
                         sym = symbol["symbol"]
                         if sym.lower() in text:
-                            if "close" in text or "sell" in text:
+                            if has_close:
                                 decisions[sym] = {
                                     "action": "CLOSE",
                                     "reasoning": "Detected CLOSE or SELL keyword in fallback parsing.",
                                     "confidence": 60  # Default confidence for fallback
                                 }
-                            elif "keep" in text or "hold" in text or "open" in text:
+                            elif has_keep:
                                 decisions[sym] = {
                                     "action": "KEEP",
                                     "reasoning": "Detected KEEP/HOLD keyword in fallback parsing.",
@@ -1387,16 +1878,18 @@ Return ONLY valid JSON with the following structure:
                 # ============================================================================
                 # APPLY 3-TIER VALIDATION SYSTEM
                 # ============================================================================
-                cprint("\n" + "=" * 60, "magenta")
-                cprint("🛡️ APPLYING 3-TIER VALIDATION SYSTEM", "white", "on_magenta", attrs=["bold"])
-                cprint("=" * 60, "magenta")
+                _v(1, "\n" + _SEP, "magenta")
+                _v(1, "🛡️ APPLYING 3-TIER VALIDATION SYSTEM", "white", "on_magenta", attrs=["bold"])
+                _v(1, _SEP, "magenta")
 
                 for symbol, decision in decisions.items():
-                    action = decision.get("action", "KEEP")
+                    # Normalize once at decode time - everything downstream
+                    # compares against the uppercase literals
+                    action = decision.get("action", "KEEP").upper()
                     reason = decision.get("reasoning", "")
                     ai_confidence = int(decision.get("confidence", 0))
 
-                    if action.upper() == "CLOSE":
+                    if action == "CLOSE":
                         # Get position data for validation
                         pos_data = positions_data.get(symbol, [{}])[0]
                         pnl_percent = pos_data.get("pnl_percent", 0)
@@ -1423,76 +1916,94 @@ Return ONLY valid JSON with the following structure:
                             cprint(f"🛡️ {symbol}: CLOSE BLOCKED → FORCING KEEP", "cyan", attrs=["bold"])
                             add_console_log(f"🛡️ {symbol} CLOSE blocked: {validation_reason}", "warning")
                     else:
-                        # KEEP decision - no validation needed
+                        # KEEP decision - no validation needed (store the
+                        # normalized action so readers skip the .upper())
+                        decision["action"] = action
                         validated_decisions[symbol] = decision
 
             except Exception as e:
                 cprint(f"❌ Error in AI analysis: {e}", "red")
-                import traceback
                 traceback.print_exc()
 
         # Print final validated decisions
-        cprint("\n" + "=" * 60, "magenta")
+        _v(1, "\n" + _SEP, "magenta")
         cprint("🎯 FINAL VALIDATED DECISIONS:", "white", "on_magenta", attrs=["bold"])
-        cprint("=" * 60, "magenta")
+        _v(1, _SEP, "magenta")
 
+        pending_logs = []
         for symbol, decision in validated_decisions.items():
             action = decision.get("action", "UNKNOWN")
             reason = decision.get("reasoning", "")
             confidence = decision.get("confidence", 0)
-            color = "red" if action.upper() == "CLOSE" else "green"
+            color = "red" if action == "CLOSE" else "green"
             cprint(f"   {symbol:<10} → {action:<6} | {reason}", color)
             # Short format for dashboard: "SYMBOL -> ACTION"
-            add_console_log(f"{symbol} -> {action}", "info")
+            pending_logs.append((f"{symbol} -> {action}", "info"))
 
-            # Short format for dashboard
-            if action.upper() == "CLOSE":
-                add_console_log(f"{symbol} -> CLOSE ({confidence}% Sure)", "warning")
+            if action == "CLOSE":
+                pending_logs.append((f"{symbol} -> CLOSE ({confidence}% Sure)", "warning"))
             else:
-                add_console_log(f"{symbol} -> KEEP", "info")
+                pending_logs.append((f"{symbol} -> KEEP", "info"))
+
+        # One batched dashboard write for the whole decision set
+        add_console_logs_bulk(pending_logs)
 
-        cprint("=" * 60 + "\n", "magenta")
+        _v(1, _SEP + "\n", "magenta")
         return validated_decisions
 
+    def _close_one_position(self, symbol, decision):
+        """Close one position and clean up the tracker (pool worker)"""
+        cprint(f"\n   📉 Closing {symbol}...", "yellow")
+        cprint(f"   💡 Reason: {decision['reasoning']}", "white")
+
+        close_result = n.close_complete_position(symbol, self.account)
+
+        if close_result:
+            # Remove from position tracker
+            if POSITION_TRACKER_AVAILABLE:
+                remove_position(symbol)
+                cprint(f"   📍 Removed {symbol} from position tracker", "cyan")
+
+            cprint(f"✅ {symbol} position closed successfully", "green", attrs=["bold"])
+            add_console_log(f"✅ Closed {symbol} | Reason: {decision['reasoning']}", "success")
+            return True
+
+        cprint(f"   ⚠️ Position close returned False for {symbol}", "yellow")
+        add_console_log(f"⚠️ Close may have failed for {symbol}", "warning")
+        return False
+
     def execute_position_closes(self, close_decisions):
         """Execute closes for positions marked by AI"""
         if not close_decisions:
             return
 
-        cprint("\n" + "=" * 60, "red")
+        _v(1, "\n" + _SEP, "red")
         cprint("🔄 EXECUTING POSITION CLOSES", "white", "on_red", attrs=["bold"])
-        cprint("=" * 60, "red")
+        _v(1, _SEP, "red")
 
         closed_count = 0
-
-        for symbol, decision in close_decisions.items():
-            if decision["action"] == "CLOSE":
-                try:
-                    cprint(f"\n   📉 Closing {symbol}...", "yellow")
-                    cprint(f"   💡 Reason: {decision['reasoning']}", "white")
-
-                    close_result = n.close_complete_position(symbol, self.account)
-
-                    if close_result:
-                        # Remove from position tracker
-                        if POSITION_TRACKER_AVAILABLE:
-                            remove_position(symbol)
-                            cprint(f"   📍 Removed {symbol} from position tracker", "cyan")
-
-                        cprint(f"✅ {symbol} position closed successfully", "green", attrs=["bold"])
-                        add_console_log(f"✅ Closed {symbol} | Reason: {decision['reasoning']}", "success")
-
-                        closed_count += 1
-                    else:
-                        cprint(f"   ⚠️ Position close returned False for {symbol}", "yellow")
-                        add_console_log(f"⚠️ Close may have failed for {symbol}", "warning")
-
-                    time.sleep(2)
-
-                except Exception as e:
-                    cprint(f"   ❌ Error closing {symbol}: {e}", "red")
-                    import traceback
-                    traceback.print_exc()
+        to_close = {s: d for s, d in close_decisions.items() if d["action"] == "CLOSE"}
+
+        if to_close:
+            # The close orders are independent - a bounded pool replaces the
+            # serial submit + 2s sleep chain, so K closes cost ~one RTT
+            # instead of K*(RTT + 2s). max_workers keeps us under exchange
+            # rate limits.
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
+            with ThreadPoolExecutor(max_workers=min(4, len(to_close))) as pool:
+                futures = {
+                    pool.submit(self._close_one_position, symbol, decision): symbol
+                    for symbol, decision in to_close.items()
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        if future.result():
+                            closed_count += 1
+                    except Exception as e:
+                        cprint(f"   ❌ Error closing {symbol}: {e}", "red")
+                        traceback.print_exc()
 
         if closed_count > 0:
             cprint(
@@ -1504,31 +2015,35 @@ Return ONLY valid JSON with the following structure:
         else:
             cprint("\n   ℹ️  No positions needed closing", "cyan")
 
-        cprint("=" * 60 + "\n", "red")
+        _v(1, _SEP + "\n", "red")
 
     # ==================================================
     # Strategy Context Helpers
     # ==================================================
 
     def _get_cached_strategy_context(self, token):
-        try:
-            now = datetime.utcnow()
+        """Return (context, formatted_text) for a token, or None
 
-            cache = self._strategy_context_cache.get(token)
-            if cache and cache["expires_at"] > now:
-                return cache["data"]
+        The prompt text is formatted once per TTL refresh and cached
+        alongside the context - re-serializing the same dict for every
+        analysis call was pure overhead.
+        """
+        try:
+            entry = self._strategy_context_cache.get(token)
+            if entry is not None:
+                return entry
 
             if not self.strategy_agent:
                 return None
 
             strategy_context = self.strategy_agent.get_enriched_context(token)
+            if strategy_context is None:
+                return None
 
-            self._strategy_context_cache[token] = {
-                "data": strategy_context,
-                "expires_at": now + timedelta(seconds=self.STRATEGY_CONTEXT_TTL),
-            }
-
-            return strategy_context
+            text, _ = self._format_strategy_context_text(strategy_context)
+            entry = (strategy_context, text)
+            self._strategy_context_cache[token] = entry
+            return entry
 
         except Exception as e:
             cprint(f"⚠️ Strategy context error: {e}", "yellow")
@@ -1539,10 +2054,17 @@ Return ONLY valid JSON with the following structure:
         if not strategy_context:
             return "No strategy intelligence available.", {}
 
+        # Identity memo: the entry keeps the context referenced so its id
+        # can't be recycled while the memo holds it
+        memo = self._strategy_text_memo
+        hit = memo.get(id(strategy_context))
+        if hit is not None and hit[0] is strategy_context:
+            return hit[1], strategy_context
+
         lines = []
 
         lines.append("STRATEGY INTELLIGENCE (JSON)")
-        lines.append(json.dumps(strategy_context, indent=2))
+        lines.append(_dumps_indent(strategy_context))
 
         aggregate = strategy_context.get("aggregate", {})
 
@@ -1556,7 +2078,11 @@ Return ONLY valid JSON with the following structure:
         lines.append(f"- Conflict level: {aggregate.get('conflict_level')}")
         lines.append(f"- Timestamp: {strategy_context.get('timestamp')}")
 
-        return "\n".join(lines), strategy_context
+        text = "\n".join(lines)
+        if len(memo) >= 64:
+            memo.clear()
+        memo[id(strategy_context)] = (strategy_context, text)
+        return text, strategy_context
    
 
    
@@ -1571,7 +2097,7 @@ Return ONLY valid JSON with the following structure:
             position_context = "CURRENT POSITION: None (You have no exposure)."
 
             try:
-                raw_pos_data = n.get_position(token, self.account)
+                raw_pos_data = _get_position(token, self.account)
                 _, im_in_pos, pos_size, _, entry_px, pnl_perc, is_long = raw_pos_data
 
                 if im_in_pos:
@@ -1619,22 +2145,7 @@ Return ONLY valid JSON with the following structure:
                 )
 
                 # Store the recommendation only — no trade execution here
-                self.recommendations_df = pd.concat(
-                    [
-                        self.recommendations_df,
-                        pd.DataFrame(
-                            [
-                                {
-                                    "token": token,
-                                    "action": action,
-                                    "confidence": confidence,
-                                    "reasoning": reasoning,
-                                }
-                            ]
-                        ),
-                    ],
-                    ignore_index=True,
-                )
+                self._append_recommendation(token, action, confidence, reasoning)
 
                 cprint(f"✅ Swarm analysis complete for {token[:8]}!", "green")
                 add_console_log(f"✅ Swarm  {token} -> {action} | {confidence}% Sure", "success")
@@ -1656,19 +2167,20 @@ Return ONLY valid JSON with the following structure:
                     else:
                         token_name = token
 
-                    strat_obj = None
+                    cached_ctx = None
                     strategy_context_text = "No strategy intelligence available."
                     strategy_context_json = {}
 
-                    # Attempt to get enriched context from StrategyAgent (cached)
+                    # Attempt to get enriched context from StrategyAgent
+                    # (context and formatted text cached together)
                     try:
-                        strat_obj = self._get_cached_strategy_context(token_name)
+                        cached_ctx = self._get_cached_strategy_context(token_name)
                     except Exception as e:
                         cprint(f"⚠️ Error fetching strategy context for {token_name}: {e}", "yellow")
-                        strat_obj = None
+                        cached_ctx = None
 
-                    if strat_obj:
-                        strategy_context_text, strategy_context_json = self._format_strategy_context_text(strat_obj)
+                    if cached_ctx:
+                        strategy_context_json, strategy_context_text = cached_ctx
                         add_console_log("Strategies loaded", "success")
 
                     else:
@@ -1677,7 +2189,7 @@ Return ONLY valid JSON with the following structure:
                             try:
                                 strategy_context_text = (
                                     "Strategy Signals Available:\n" +
-                                    json.dumps(market_data["strategy_signals"], indent=2)
+                                    _dumps_indent(market_data["strategy_signals"])
                                 )
                                 strategy_context_json = {"legacy_signals": market_data["strategy_signals"]}
                             except Exception:
@@ -1709,34 +2221,14 @@ Return ONLY valid JSON with the following structure:
                 lines = response.split("\n")
                 action = lines[0].strip() if lines else "NOTHING"
 
-                confidence = 0
-                for line in lines:
-                    if "confidence" in line.lower():
-                        try:
-                            confidence = int("".join(filter(str.isdigit, line)))
-                        except Exception:
-                            confidence = 50
+                conf_match = _CONFIDENCE_LINE_RE.search(response)
+                confidence = min(int(conf_match.group(1)), 100) if conf_match else 0
 
                 reasoning = (
                     "\n".join(lines[1:]) if len(lines) > 1 else "No detailed reasoning provided"
                 )
 
-                self.recommendations_df = pd.concat(
-                    [
-                        self.recommendations_df,
-                        pd.DataFrame(
-                            [
-                                {
-                                    "token": token,
-                                    "action": action,
-                                    "confidence": confidence,
-                                    "reasoning": reasoning,
-                                }
-                            ]
-                        ),
-                    ],
-                    ignore_index=True,
-                )
+                self._append_recommendation(token, action, confidence, reasoning)
 
                 add_console_log(f"Analysis Complete for {token[:4]}...", "info")
                 add_console_log(f"{token} -> {action} | {confidence}%", "success")
@@ -1745,22 +2237,7 @@ Return ONLY valid JSON with the following structure:
 
         except Exception as e:
             print(f"❌ Error in AI analysis: {str(e)}")
-            self.recommendations_df = pd.concat(
-                [
-                    self.recommendations_df,
-                    pd.DataFrame(
-                        [
-                            {
-                                "token": token,
-                                "action": "NOTHING",
-                                "confidence": 0,
-                                "reasoning": f"Error during analysis: {str(e)}",
-                            }
-                        ]
-                    ),
-                ],
-                ignore_index=True,
-            )
+            self._append_recommendation(token, "NOTHING", 0, f"Error during analysis: {str(e)}")
             return None
 
 
@@ -1783,9 +2260,9 @@ Return ONLY valid JSON with the following structure:
             list: List of action dictionaries from AI, or empty list if no actions
         """
         try:
-            cprint("\n" + "=" * 60, "cyan")
+            _v(1, "\n" + _SEP, "cyan")
             cprint("🧠 AI-DRIVEN SMART ALLOCATION", "white", "on_blue", attrs=["bold"])
-            cprint("=" * 60, "cyan")
+            _v(1, _SEP, "cyan")
 
             # ================================================================
             # STEP 1: Collect Current Portfolio State
@@ -1793,37 +2270,61 @@ Return ONLY valid JSON with the following structure:
             open_positions = {}
             total_position_value = 0
 
-            for sym in self.symbols:
+            if EXCHANGE == "HYPERLIQUID":
+                # One user_state request returns every position - the
+                # per-symbol loop was one HTTP round-trip each
                 try:
-                    if EXCHANGE == "HYPERLIQUID":
-                        pos_data = n.get_position(sym, self.account)
-                    else:
-                        pos_data = n.get_position(sym)
-
-                    _, im_in_pos, pos_size, _, entry_px, pnl_pct, is_long = pos_data
+                    all_positions = n.get_all_positions(_get_balance_address())
+                except Exception as e:
+                    cprint(f"⚠️ Bulk position fetch failed: {e}", "yellow")
+                    all_positions = []
 
-                    if im_in_pos and pos_size != 0:
-                        notional = abs(float(pos_size) * float(entry_px))
-                        margin = notional / LEVERAGE
-                        open_positions[sym] = {
-                            "direction": "LONG" if is_long else "SHORT",
-                            "size": abs(float(pos_size)),
-                            "entry_price": float(entry_px),
-                            "notional_usd": round(notional, 2),
-                            "margin_usd": round(margin, 2),
-                            "pnl_percent": round(float(pnl_pct), 2),
-                        }
-                        total_position_value += margin
-                except Exception:
-                    continue
+                for pos in all_positions:
+                    sym = pos["symbol"]
+                    if sym not in self._symbol_set or sym in open_positions:
+                        continue
+                    size = float(pos["size"])
+                    entry_px = float(pos["entry_price"])
+                    notional = abs(size * entry_px)
+                    margin = notional / LEVERAGE
+                    open_positions[sym] = {
+                        "direction": "LONG" if pos["is_long"] else "SHORT",
+                        "size": abs(size),
+                        "entry_price": entry_px,
+                        "notional_usd": round(notional, 2),
+                        "margin_usd": round(margin, 2),
+                        "pnl_percent": round(float(pos["pnl_percent"]), 2),
+                    }
+                    total_position_value += margin
+            else:
+                for sym in self.symbols:
+                    try:
+                        pos_data = _get_position(sym)
+
+                        _, im_in_pos, pos_size, _, entry_px, pnl_pct, is_long = pos_data
+
+                        if im_in_pos and pos_size != 0:
+                            notional = abs(float(pos_size) * float(entry_px))
+                            margin = notional / LEVERAGE
+                            open_positions[sym] = {
+                                "direction": "LONG" if is_long else "SHORT",
+                                "size": abs(float(pos_size)),
+                                "entry_price": float(entry_px),
+                                "notional_usd": round(notional, 2),
+                                "margin_usd": round(margin, 2),
+                                "pnl_percent": round(float(pnl_pct), 2),
+                            }
+                            total_position_value += margin
+                    except Exception:
+                        continue
 
             # ================================================================
             # STEP 2: Collect AI Signals
             # ================================================================
             signals = []
-            for _, row in self.recommendations_df.iterrows():
+            for row in self._rec_rows:
                 token = row["token"]
-                if token not in self.symbols:
+                if token not in self._symbol_set:
                     continue
 
                 # Skip SELL signals in LONG_ONLY mode (can't open shorts)
@@ -1862,29 +2363,31 @@ Return ONLY valid JSON with the following structure:
             # ================================================================
             # STEP 4: Build Portfolio State Summary for AI
             # ================================================================
+            # Stream straight into one buffer - skips the intermediate list
+            # plus the final join pass
             if open_positions:
-                portfolio_lines = ["OPEN POSITIONS:"]
+                buf = io.StringIO()
+                buf.write("OPEN POSITIONS:")
                 for sym, pos in open_positions.items():
                     pnl_emoji = "🟢" if pos["pnl_percent"] >= 0 else "🔴"
-                    portfolio_lines.append(
-                        f"  - {sym}: {pos['direction']} | ${pos['notional_usd']:.2f} notional | "
+                    buf.write(
+                        f"\n  - {sym}: {pos['direction']} | ${pos['notional_usd']:.2f} notional | "
                         f"PnL: {pnl_emoji} {pos['pnl_percent']:+.2f}%"
                     )
-                portfolio_lines.append(f"\nTotal Position Value: ${total_position_value:.2f} margin")
+                buf.write(f"\n\nTotal Position Value: ${total_position_value:.2f} margin")
+                portfolio_state = buf.getvalue()
             else:
-                portfolio_lines = ["OPEN POSITIONS: None"]
+                portfolio_state = "OPEN POSITIONS: None"
 
-            portfolio_state = "\n".join(portfolio_lines)
-
-            # Build signals summary
-            signal_lines = []
+            # Build signals summary the same way
+            buf = io.StringIO()
             for sig in signals:
                 emoji = "📈" if sig["action"] == "BUY" else "📉" if sig["action"] == "SELL" else "⏸️"
                 in_position = "✓ IN POSITION" if sig["symbol"] in open_positions else ""
-                signal_lines.append(
-                    f"  - {sig['symbol']}: {emoji} {sig['action']} ({sig['confidence']}% confidence) {in_position}"
+                buf.write(
+                    f"\n  - {sig['symbol']}: {emoji} {sig['action']} ({sig['confidence']}% confidence) {in_position}"
                 )
-            signals_text = "\n".join(signal_lines)
+            signals_text = buf.getvalue()[1:]
 
             cprint(f"\n📊 Portfolio State:", "cyan")
             cprint(portfolio_state, "white")
@@ -1938,7 +2441,7 @@ Return ONLY valid JSON with the following structure:
                         continue
                     if "symbol" not in action or "action" not in action:
                         continue
-                    if action["symbol"] not in self.symbols:
+                    if action["symbol"] not in self._symbol_set:
                         continue
 
                     # Skip HOLD actions - nothing to execute
@@ -1951,9 +2454,9 @@ Return ONLY valid JSON with the following structure:
                 # ================================================================
                 # STEP 7: Display AI Allocation Plan
                 # ================================================================
-                cprint("\n" + "=" * 60, "green")
+                _v(1, "\n" + _SEP, "green")
                 cprint("🎯 AI ALLOCATION PLAN:", "white", "on_green", attrs=["bold"])
-                cprint("=" * 60, "green")
+                _v(1, _SEP, "green")
 
                 for action in valid_actions:
                     action_type = action["action"]
@@ -1978,7 +2481,7 @@ Return ONLY valid JSON with the following structure:
                 if allocation_plan.get("reasoning"):
                     cprint(f"\n   💡 Strategy: {allocation_plan['reasoning']}", "magenta")
 
-                cprint("=" * 60 + "\n", "green")
+                _v(1, _SEP + "\n", "green")
                 add_console_log(f"Planned {len(valid_actions)} actions", "info")
 
                 return valid_actions
@@ -1990,7 +2493,6 @@ Return ONLY valid JSON with the following structure:
 
         except Exception as e:
             cprint(f"❌ Error in portfolio allocation: {str(e)}", "red")
-            import traceback
             traceback.print_exc()
             return []
 
@@ -2078,9 +2580,9 @@ Return ONLY valid JSON with the following structure:
             return
 
         try:
-            cprint("\n" + "=" * 60, "yellow")
+            _v(1, "\n" + _SEP, "yellow")
             cprint("🚀 EXECUTING AI ALLOCATION PLAN", "white", "on_yellow", attrs=["bold"])
-            cprint("=" * 60, "yellow")
+            _v(1, _SEP, "yellow")
             add_console_log(f"Executing {len(actions_list)} allocation actions", "info")
 
             # Sort actions: CLOSE first, then REDUCE, then OPEN/INCREASE
@@ -2099,7 +2601,7 @@ Return ONLY valid JSON with the following structure:
                 if not symbol or not action_type:
                     continue
 
-                if symbol not in self.symbols:
+                if symbol not in self._symbol_set:
                     cprint(f"⚠️ Skipping {symbol} - not in configured symbols", "yellow")
                     continue
 
@@ -2111,9 +2613,9 @@ Return ONLY valid JSON with the following structure:
                 try:
                     # Get current position state
                     if EXCHANGE == "HYPERLIQUID":
-                        pos_data = n.get_position(symbol, self.account)
+                        pos_data = _get_position(symbol, self.account)
                     else:
-                        pos_data = n.get_position(symbol)
+                        pos_data = _get_position(symbol)
 
                     _, im_in_pos, pos_size, _, entry_px, pnl_pct, is_long = pos_data
                     current_notional = abs(float(pos_size) * float(entry_px)) if im_in_pos else 0
@@ -2370,11 +2872,14 @@ Return ONLY valid JSON with the following structure:
                     cprint(f"   ❌ Error: {str(e)}", "red")
                     add_console_log(f"❌ {symbol} {action_type} failed: {e}", "error")
                     failed_count += 1
-                    import traceback
                     traceback.print_exc()
 
                 time.sleep(2)  # Rate limiting between trades
 
+            # Fills change the balance - make the next read hit the exchange
+            if executed_count:
+                invalidate_balance_cache()
+
             # Summary
             cprint(f"\n{'=' * 60}", "green")
             cprint(f"✅ EXECUTION COMPLETE: {executed_count} succeeded, {failed_count} failed", "green", attrs=["bold"])
@@ -2383,7 +2888,6 @@ Return ONLY valid JSON with the following structure:
 
         except Exception as e:
             cprint(f"❌ Error in execute_allocations: {e}", "red")
-            import traceback
             traceback.print_exc()
 
     def handle_exits(self):
@@ -2411,7 +2915,9 @@ Return ONLY valid JSON with the following structure:
         positions_closed = 0
         positions_held = 0
 
-        for _, row in self.recommendations_df.iterrows():
+        # Iterate the recommendation dicts directly - iterrows builds a
+        # fresh Series per row
+        for row in self._rec_rows:
             token = row["token"]
             token_short = token[:8] + "..." if len(token) > 8 else token
 
@@ -2423,9 +2929,9 @@ Return ONLY valid JSON with the following structure:
             # Get position with direction info
             try:
                 if EXCHANGE == "HYPERLIQUID":
-                    pos_data = n.get_position(token, self.account)
+                    pos_data = _get_position(token, self.account)
                 else:
-                    pos_data = n.get_position(token)
+                    pos_data = _get_position(token)
 
                 _, im_in_pos, pos_size, _, entry_px, pnl_perc, is_long = pos_data
 
@@ -2557,6 +3063,10 @@ Return ONLY valid JSON with the following structure:
                 else:  # BUY
                     cprint("📈 BUY signal - LONG will be opened in allocation phase", "white", "on_green")
 
+        # Closes free up capital - allocation phase should see a fresh balance
+        if positions_closed:
+            invalidate_balance_cache()
+
         # Summary
         cprint(f"\n{'=' * 60}", "green")
         cprint(f"✅ PHASE 1 COMPLETE: Closed {positions_closed}, Held {positions_held} positions", "green", attrs=["bold"])
@@ -2565,9 +3075,9 @@ Return ONLY valid JSON with the following structure:
 
     def show_final_portfolio_report(self):
         """Display final portfolio status - NO LOOPS, just a snapshot"""
-        cprint("\n" + "=" * 60, "cyan")
+        _v(1, "\n" + _SEP, "cyan")
         cprint("📊 FINAL PORTFOLIO REPORT", "white", "on_blue", attrs=["bold"])
-        cprint("=" * 60, "cyan")
+        _v(1, _SEP, "cyan")
 
         # CRITICAL: Use self.symbols (instance variable) NOT global SYMBOLS/MONITORED_TOKENS
         check_tokens = self.symbols
@@ -2579,7 +3089,7 @@ Return ONLY valid JSON with the following structure:
 
         for token in check_tokens:
             try:
-                pos_data = n.get_position(token, self.account)
+                pos_data = _get_position(token, self.account)
                 _, im_in_pos, pos_size, _, entry_px, pnl_perc, is_long = pos_data
 
                 if im_in_pos and pos_size != 0:
@@ -2599,7 +3109,7 @@ Return ONLY valid JSON with the following structure:
         if not active_positions:
             cprint("   (No active positions)", "cyan")
 
-        cprint("=" * 60 + "\n", "cyan")
+        _v(1, _SEP + "\n", "cyan")
 
     def should_stop(self):
         """Enhanced stop signal checking - only check external stop signals"""
@@ -2618,7 +3128,7 @@ Return ONLY valid JSON with the following structure:
                 if symbol in EXCLUDED_TOKENS:
                     continue
                     
-                pos_data = n.get_position(symbol, self.account)
+                pos_data = _get_position(symbol, self.account)
                 _, im_in_pos, _, _, _, pnl_perc, _ = pos_data
                 
                 if im_in_pos and pnl_perc != 0:
@@ -2650,10 +3160,9 @@ Return ONLY valid JSON with the following structure:
 
             add_console_log(f"TRADING CYCLE STARTED", "info")
 
-            # CRITICAL FIX: Reset recommendations_df at the start of each cycle
-            self.recommendations_df = pd.DataFrame(
-                columns=["token", "action", "confidence", "reasoning"]
-            )
+            # CRITICAL FIX: Reset recommendations at the start of each cycle
+            self._rec_rows = []
+            self._rec_version += 1
             cprint("📋 Recommendations cleared for fresh cycle", "cyan")
 
             # Check for stop signal
@@ -2661,6 +3170,10 @@ Return ONLY valid JSON with the following structure:
                 add_console_log("ℹ️ Stop signal received - aborting cycle", "warning")
                 return
 
+            # Start the balance round-trip now so it overlaps with data
+            # collection below - later reads resolve from the warm cache
+            prefetch_account_balance(self.account)
+
             # STEP 0: DISPLAY VOLUME INTELLIGENCE SUMMARY (if available)
             if INTELLIGENCE_AVAILABLE:
                 volume_summary = get_volume_summary()
@@ -2679,6 +3192,7 @@ Return ONLY valid JSON with the following structure:
                 return
 
             # STEP 2: COLLECT MARKET DATA
+            from src.data.ohlcv_collector import collect_all_tokens
             tokens_to_trade = self.symbols
             add_console_log(f"📊 Collecting market data for {len(tokens_to_trade)} tokens...", "info")
             cprint("📊 Collecting market data for analysis...", "white", "on_blue")
@@ -2725,22 +3239,58 @@ Return ONLY valid JSON with the following structure:
 
             # STEP 5: ANALYZE TOKENS FOR NEW ENTRIES
             cprint("\n📈 Analyzing tokens for new entry opportunities...", "white", "on_blue")
-            for token, data in market_data.items():
-                if self.should_stop():
-                    add_console_log(f"ℹ️ Stop signal received - stopping analysis at {token}", "warning")
-                    return
+            # While one token's LLM call is in flight, warm the next token's
+            # strategy context on a background thread - the analyses are
+            # independent, so the context fetch hides behind model latency
+            from concurrent.futures import ThreadPoolExecutor
+
+            tokens_in_order = list(market_data.keys())
+
+            if ANALYSIS_MAX_WORKERS > 1 and len(tokens_in_order) > 1:
+                # Fan the independent per-token analyses out on threads -
+                # the cycle waits on the slowest LLM call instead of the sum
+                workers = min(ANALYSIS_MAX_WORKERS, len(tokens_in_order))
+                cprint(f"\n🧵 Analyzing {len(tokens_in_order)} tokens across {workers} workers...", "cyan")
+
+                for token in tokens_in_order:
+                    if strategy_signals and token in strategy_signals:
+                        market_data[token]["strategy_signals"] = strategy_signals[token]
+
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis") as pool:
+                    futures = {
+                        token: pool.submit(self.analyze_market_data, token, market_data[token])
+                        for token in tokens_in_order
+                    }
+                    for token in tokens_in_order:
+                        analysis = futures[token].result()
+                        if analysis:
+                            print(f"\n📈 Analysis for {token}:")
+                            print(analysis)
+                            print("\n" + "=" * 50 + "\n")
+            else:
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ctx-prefetch") as ctx_pool:
+                    for idx, token in enumerate(tokens_in_order):
+                        data = market_data[token]
+
+                        if self.should_stop():
+                            add_console_log(f"ℹ️ Stop signal received - stopping analysis at {token}", "warning")
+                            return
+
+                        cprint(f"\n📊 Analyzing {token}...", "white", "on_green")
+                        add_console_log(f"📊 Analyzing {token}...", "info")
 
-                cprint(f"\n📊 Analyzing {token}...", "white", "on_green")
-                add_console_log(f"📊 Analyzing {token}...", "info")
+                        if strategy_signals and token in strategy_signals:
+                            data["strategy_signals"] = strategy_signals[token]
 
-                if strategy_signals and token in strategy_signals:
-                    data["strategy_signals"] = strategy_signals[token]
+                        if idx + 1 < len(tokens_in_order):
+                            ctx_pool.submit(self._get_cached_strategy_context,
+                                            tokens_in_order[idx + 1])
 
-                analysis = self.analyze_market_data(token, data)
-                if analysis:
-                    print(f"\n📈 Analysis for {token}:")
-                    print(analysis)
-                    print("\n" + "=" * 50 + "\n")
+                        analysis = self.analyze_market_data(token, data)
+                        if analysis:
+                            print(f"\n📈 Analysis for {token}:")
+                            print(analysis)
+                            print("\n" + "=" * 50 + "\n")
 
             if self.should_stop():
                 add_console_log("ℹ️ Stop signal received - aborting cycle", "warning")
@@ -2798,7 +3348,6 @@ Return ONLY valid JSON with the following structure:
 
             except Exception as exec_err:
                 cprint(f"❌ Execution pipeline failed: {exec_err}", "red")
-                import traceback
                 traceback.print_exc()
                 add_console_log(f"Execution error: {exec_err}", "error")
 
@@ -2841,7 +3390,6 @@ Return ONLY valid JSON with the following structure:
 
         except Exception as e:
             cprint(f"\n❌ Error in trading cycle: {e}", "white", "on_red")
-            import traceback
             traceback.print_exc()
 
 
@@ -2871,7 +3419,6 @@ def main():
             break
         except Exception as e:
             cprint(f"\n❌ Error in main loop: {e}", "white", "on_red")
-            import traceback
             traceback.print_exc()
             cprint(f"\n⏰ Retrying in {SLEEP_BETWEEN_RUNS_MINUTES} minutes...", "yellow")
             time.sleep(SLEEP_BETWEEN_RUNS_MINUTES * 60)
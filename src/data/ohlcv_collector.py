@@ -144,8 +144,12 @@ def collect_all_tokens(tokens=None, days_back=None, timeframe=None, exchange="SO
     cprint(f"🏦 Exchange: {exchange}", "cyan")
     cprint(f"📊 Settings: {days_back} days @ {timeframe} timeframe", "cyan")
 
+    # Route through the shared TTL cache so a cycle that already fetched a
+    # token (e.g. via a strategy) doesn't hit the API again
+    from src.utils.market_cache import get_ohlcv
+
     for token in tokens:
-        data = collect_token_data(token, days_back, timeframe, exchange=exchange)
+        data = get_ohlcv(token, days_back, timeframe, exchange=exchange)
         if data is not None:
             market_data[token] = data
 
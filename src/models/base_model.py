@@ -57,6 +57,70 @@ class BaseModel(ABC):
             cprint(f"❌ Model error: {str(e)}", "red")
             return None
     
+    def generate_response_n(self, system_prompt, user_content, temperature=0.7, max_tokens=None, n=1):
+        """Return n sampled completions from one request (OpenAI-style n=)
+
+        One HTTP round-trip replaces n when the provider supports multi-
+        sampling; otherwise falls back to n sequential generate_response
+        calls so callers always get a list of n content strings (None for
+        failed samples).
+        """
+        if n <= 1:
+            response = self.generate_response(system_prompt, user_content, temperature, max_tokens)
+            return [getattr(response, "content", response) if response else None]
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens if max_tokens else self.max_tokens,
+                n=n
+            )
+            contents = [choice.message.content for choice in response.choices]
+            # Some providers silently ignore n and return one choice
+            while len(contents) < n:
+                contents.append(None)
+            return contents
+        except Exception as e:
+            cprint(f"⚠️ Multi-sample unavailable ({str(e)[:80]}), sampling sequentially", "yellow")
+            contents = []
+            for _ in range(n):
+                response = self.generate_response(system_prompt, user_content, temperature, max_tokens)
+                contents.append(getattr(response, "content", response) if response else None)
+            return contents
+
+    def generate_response_stream(self, system_prompt, user_content, temperature=0.7, max_tokens=None):
+        """Yield response text chunks as they arrive (OpenAI-style streaming)
+
+        Works for any OpenAI-compatible client; models whose clients don't
+        support streaming fall back to yielding the full response once.
+        """
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_content}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens if max_tokens else self.max_tokens,
+                stream=True
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        except Exception as e:
+            cprint(f"⚠️ Streaming unavailable ({str(e)[:80]}), using full response", "yellow")
+            response = self.generate_response(system_prompt, user_content, temperature, max_tokens)
+            content = getattr(response, "content", None)
+            if content:
+                yield content
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the model is available and properly configured"""
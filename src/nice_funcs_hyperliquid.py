@@ -58,9 +58,78 @@ DEFAULT_LEVERAGE = 20  # Change this to adjust leverage globally (1-50x on Hyper
 # Constants
 BATCH_SIZE = 5000  # MAX IS 5000 FOR HYPERLIQUID
 MAX_RETRIES = 3
+
+# ============================================================================
+# 🚀 Numba kernels for the hot indicator loops (optional)
+# ============================================================================
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _sma_kernel(x, w):
+        n = x.shape[0]
+        out = np.empty(n)
+        s = 0.0
+        for i in range(n):
+            s += x[i]
+            if i >= w:
+                s -= x[i - w]
+            out[i] = s / w if i >= w - 1 else np.nan
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _rsi_kernel(x, w):
+        # Wilder's smoothing, same as pandas_ta's default RMA-based RSI
+        n = x.shape[0]
+        out = np.full(n, np.nan)
+        if n <= w:
+            return out
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(1, w + 1):
+            d = x[i] - x[i - 1]
+            if d > 0.0:
+                avg_gain += d
+            else:
+                avg_loss -= d
+        avg_gain /= w
+        avg_loss /= w
+        out[w] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        for i in range(w + 1, n):
+            d = x[i] - x[i - 1]
+            gain = d if d > 0.0 else 0.0
+            loss = -d if d < 0.0 else 0.0
+            avg_gain = (avg_gain * (w - 1) + gain) / w
+            avg_loss = (avg_loss * (w - 1) + loss) / w
+            out[i] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return out
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def warmup_indicator_kernels():
+    """Trigger numba compilation once at startup instead of mid-cycle
+
+    cache=True persists the compiled kernels to disk, so after the first
+    run this is just a cache load. No-op when numba isn't installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    dummy = np.arange(64, dtype=np.float64)
+    _sma_kernel(dummy, 20)
+    _rsi_kernel(dummy, 14)
 MAX_ROWS = 5000
 BASE_URL = 'https://api.hyperliquid.xyz/info'
 
+# Shared HTTP session - keeps the TLS connection to the API alive across
+# calls instead of paying DNS + TCP + TLS setup per request
+_session = requests.Session()
+
+# Cached Info client for the same reason: every Info(...) construction
+# builds a fresh session underneath
+_info_client = None
+
 # Global variable to store timestamp offset
 timestamp_offset = None
 
@@ -81,7 +150,7 @@ def get_hyperliquid_universe():
     data = {'type': 'meta'}
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(data))
+        response = _session.post(url, headers=headers, data=json.dumps(data))
         if response.status_code == 200:
             meta = response.json()
             universe = {coin['name']: coin for coin in meta.get('universe', [])}
@@ -120,7 +189,7 @@ def ask_bid(symbol):
     }
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(data))
+        response = _session.post(url, headers=headers, data=json.dumps(data))
 
         # Validate HTTP response
         if response.status_code != 200:
@@ -165,7 +234,7 @@ def get_sz_px_decimals(symbol):
     headers = {'Content-Type': 'application/json'}
     data = {'type': 'meta'}
 
-    response = requests.post(url, headers=headers, data=json.dumps(data))
+    response = _session.post(url, headers=headers, data=json.dumps(data))
 
     if response.status_code == 200:
         data = response.json()
@@ -262,7 +331,7 @@ def get_position(symbol_or_address, account=None):
 
         try:
             # Connect
-            info = Info(constants.MAINNET_API_URL, skip_ws=True)
+            info = _get_info()
             user_state = info.user_state(target_address) # 👈 Query the TARGET address
         except Exception as e:
             print(f'{colored("❌ Error fetching user state:", "red")} {e}')
@@ -351,7 +420,7 @@ def cancel_all_orders(account):
     """Cancel all open orders"""
     print(colored('🚫 Cancelling all orders', 'yellow'))
     exchange = Exchange(account, constants.MAINNET_API_URL)
-    info = Info(constants.MAINNET_API_URL, skip_ws=True)
+    info = _get_info()
 
     # Get all open orders
     open_orders = info.open_orders(account.address)
@@ -398,7 +467,7 @@ def kill_switch(symbol, account):
     """Close all open positions for a symbol at market price (supports multiple subpositions)"""
     print(colored(f'🔪 KILL SWITCH ACTIVATED for {symbol}', 'red', attrs=['bold']))
 
-    info = Info(constants.MAINNET_API_URL, skip_ws=True)
+    info = _get_info()
     exchange = Exchange(account, constants.MAINNET_API_URL)
 
     # Get all current open positions for the symbol
@@ -496,7 +565,7 @@ def get_account_value(address):
         float: Total account value including positions
     """
     try:
-        info = Info(constants.MAINNET_API_URL, skip_ws=True)
+        info = _get_info()
         
         # Handle both string addresses and Account objects
         if hasattr(address, 'address'):
@@ -668,7 +737,7 @@ def get_balance(address):
         float: Available balance in USD
     """
     try:
-        info = Info(constants.MAINNET_API_URL, skip_ws=True)
+        info = _get_info()
         
         # Handle both string addresses and Account objects
         if hasattr(address, 'address'):
@@ -695,7 +764,7 @@ def get_available_balance(address):
         float: Available balance in USD
     """
     try:
-        info = Info(constants.MAINNET_API_URL, skip_ws=True)
+        info = _get_info()
         user_state = info.user_state(address)
         
         # Get withdrawable balance (free balance not used in positions)
@@ -717,7 +786,7 @@ def get_all_positions(address):
         list: List of position dictionaries
     """
     try:
-        info = Info(constants.MAINNET_API_URL, skip_ws=True)
+        info = _get_info()
         
         # Handle both string addresses and Account objects
         if hasattr(address, 'address'):
@@ -763,8 +832,11 @@ def _get_exchange():
     return Exchange(account, constants.MAINNET_API_URL)
 
 def _get_info():
-    """Get info instance"""
-    return Info(constants.MAINNET_API_URL, skip_ws=True)
+    """Get the shared info instance (created once, connection reused)"""
+    global _info_client
+    if _info_client is None:
+        _info_client = Info(constants.MAINNET_API_URL, skip_ws=True)
+    return _info_client
 
 def _get_account_from_env():
     """Initialize and return HyperLiquid account from env"""
@@ -811,7 +883,7 @@ def _get_ohlcv(symbol, interval, start_time, end_time, batch_size=BATCH_SIZE):
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.post(
+            response = _session.post(
                 BASE_URL,
                 headers={'Content-Type': 'application/json'},
                 json=request_payload,
@@ -915,10 +987,17 @@ def add_technical_indicators(df):
         numeric_cols = ['open', 'high', 'low', 'close', 'volume']
         df[numeric_cols] = df[numeric_cols].astype('float64')
 
-        # Add basic indicators
-        df['sma_20'] = ta.sma(df['close'], length=20)
-        df['sma_50'] = ta.sma(df['close'], length=50)
-        df['rsi'] = ta.rsi(df['close'], length=14)
+        # Add basic indicators (jitted kernels skip the pandas rolling
+        # machinery when numba is available)
+        if NUMBA_AVAILABLE:
+            close = df['close'].to_numpy(dtype=np.float64)
+            df['sma_20'] = _sma_kernel(close, 20)
+            df['sma_50'] = _sma_kernel(close, 50)
+            df['rsi'] = _rsi_kernel(close, 14)
+        else:
+            df['sma_20'] = ta.sma(df['close'], length=20)
+            df['sma_50'] = ta.sma(df['close'], length=50)
+            df['rsi'] = ta.rsi(df['close'], length=14)
 
         # Add MACD
         macd = ta.macd(df['close'])
@@ -995,7 +1074,7 @@ def get_market_info():
     """Get current market info for all coins on Hyperliquid"""
     try:
         print("\n🔄 Sending request to Hyperliquid API...")
-        response = requests.post(
+        response = _session.post(
             BASE_URL,
             headers={'Content-Type': 'application/json'},
             json={"type": "allMids"}
@@ -1067,7 +1146,7 @@ def get_funding_rates(symbol):
     """
     try:
         print(f"\n🔄 Fetching funding rate for {symbol}...")
-        response = requests.post(
+        response = _session.post(
             BASE_URL,
             headers={'Content-Type': 'application/json'},
             json={"type": "metaAndAssetCtxs"}
@@ -17,6 +17,15 @@ except ImportError:
     def cprint(msg, *args, **kwargs):
         print(msg)
 
+# orjson parses AI responses ~2x faster than stdlib json - optional
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 
 class AIDecision(Enum):
     """Possible AI decisions"""
@@ -41,12 +50,16 @@ class AIResponse:
 
 def extract_json_from_text(text: str) -> Optional[Dict]:
     """Safely extract JSON object from AI model responses containing text."""
-    match = re.search(r"\{.*\}", text, re.DOTALL)
+    match = _JSON_BLOCK_RE.search(text)
     if match:
         try:
-            return json.loads(match.group())
-        except json.JSONDecodeError:
-            return None
+            return _loads(match.group())
+        except ValueError:
+            # orjson is stricter than stdlib - retry with json before giving up
+            try:
+                return json.loads(match.group())
+            except json.JSONDecodeError:
+                return None
     return None
 
 
@@ -8,6 +8,8 @@ Features:
 - Thread-safe operations
 """
 import json
+import sys
+import time
 import queue
 import hashlib
 import threading
@@ -39,6 +41,12 @@ DEDUP_WINDOW_SECONDS = 2.0  # Window to consider logs as duplicates
 DEDUP_CACHE_MAX_SIZE = 100  # Maximum number of entries in cache
 
 
+def _hms():
+    """Fast HH:MM:SS formatter (skips the datetime alloc + strftime locale path)."""
+    t = time.localtime()
+    return f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
 def _get_log_hash(message: str, level: str) -> str:
     """Generate a hash for a log entry to detect duplicates."""
     content = f"{message}|{level}"
@@ -53,7 +61,7 @@ def _is_duplicate_log(message: str, level: str) -> bool:
     Thread-safe implementation.
     """
     log_hash = _get_log_hash(message, level)
-    current_time = datetime.now().timestamp()
+    current_time = time.time()
 
     with _dedup_lock:
         # Clean up old entries beyond the dedup window
@@ -99,7 +107,7 @@ def add_console_log(message, level="info", console_file=None):
             return  # Skip duplicate log
 
         log_entry = {
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": _hms(),
             "message": message_str,
             "level": level
         }
@@ -134,12 +142,52 @@ def add_console_log(message, level="info", console_file=None):
                 print(f"⚠️ Error writing to console file: {e}")
 
         # Always print to console immediately
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message_str}")
+        print(f"[{log_entry['timestamp']}] {message_str}")
 
     except Exception as e:
         print(f"⚠️ Error in add_console_log: {e}")
 
 
+def add_console_logs_bulk(entries):
+    """
+    Add several log messages in one shot.
+
+    Per-symbol loops were emitting one add_console_log each - one queue
+    push and one stdout write per entry. This batches the console output
+    into a single write; dedup and queueing still apply per entry.
+
+    Args:
+        entries: iterable of (message, level) tuples
+    """
+    try:
+        ts = _hms()
+        out_lines = []
+        for message, level in entries:
+            message_str = str(message)
+
+            if _is_duplicate_log(message_str, level):
+                continue
+
+            log_entry = {
+                "timestamp": ts,
+                "message": message_str,
+                "level": level
+            }
+
+            try:
+                log_queue.put_nowait(log_entry)
+            except queue.Full:
+                pass
+
+            out_lines.append(f"[{ts}] {message_str}\n")
+
+        if out_lines:
+            sys.stdout.write("".join(out_lines))
+
+    except Exception as e:
+        print(f"⚠️ Error in add_console_logs_bulk: {e}")
+
+
 def log_position_open(symbol, side, size_usd, console_file=None):
     """
     Log when a trading position is opened
@@ -177,7 +225,7 @@ def add_backtest_log(message, level="info"):
             return  # Skip duplicate log
 
         log_entry = {
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": _hms(),
             "message": message_str,
             "level": level
         }
@@ -189,7 +237,7 @@ def add_backtest_log(message, level="info"):
             pass  # Queue full, skip this log
 
         # Always print to console
-        print(f"[BACKTEST {datetime.now().strftime('%H:%M:%S')}] {message_str}")
+        print(f"[BACKTEST {log_entry['timestamp']}] {message_str}")
 
     except Exception as e:
         print(f"⚠️ Error in add_backtest_log: {e}")
@@ -0,0 +1,78 @@
+"""
+🌙 Moon Dev's Shared Market Data Cache
+One TTL-cached OHLCV fetch shared by agents and strategies
+Built with love by Moon Dev 🚀
+
+The trading agent, the strategy agent and individual strategies all want
+OHLCV for the same handful of tokens each cycle. Routing every fetch
+through get_ohlcv() means the first caller pays for the API round trip
+and everyone else within the TTL window gets the cached frame back.
+
+TTLs scale with the candle timeframe (half a candle) - fresh enough that
+nobody trades on a stale bar, long enough that a full multi-agent cycle
+only fetches each token once.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cachetools import TTLCache
+
+from src.config import DAYSBACK_4_DATA, DATA_TIMEFRAME
+
+# Seconds per candle for supported timeframes (upper + lowercase variants)
+_TIMEFRAME_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1H': 3600, '2H': 7200, '4H': 14400, '6H': 21600, '8H': 28800, '12H': 43200,
+    '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '8h': 28800, '12h': 43200,
+    '1D': 86400, '1d': 86400, '3D': 259200, '3d': 259200,
+    '1W': 604800, '1w': 604800,
+}
+
+# One TTLCache per timeframe so each can carry its own TTL (half a candle,
+# floored at 60s so 1m data still gets some reuse within a cycle)
+_caches = {}
+_lock = threading.Lock()
+
+
+def _cache_for(timeframe):
+    cache = _caches.get(timeframe)
+    if cache is None:
+        ttl = max(60, _TIMEFRAME_SECONDS.get(timeframe, 3600) // 2)
+        cache = TTLCache(maxsize=512, ttl=ttl)
+        _caches[timeframe] = cache
+    return cache
+
+
+def get_ohlcv(token, days_back=None, timeframe=None, exchange="SOLANA"):
+    """Fetch OHLCV for a token, reusing a TTL-cached frame when fresh.
+
+    Same signature semantics as collect_token_data - defaults come from
+    config. Returns None (uncached) when the underlying fetch fails.
+    """
+    if days_back is None:
+        days_back = DAYSBACK_4_DATA
+    if timeframe is None:
+        timeframe = DATA_TIMEFRAME
+
+    key = (token, days_back, timeframe, exchange)
+    with _lock:
+        cache = _cache_for(timeframe)
+        cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Imported lazily so importing this module never drags in pandas/APIs
+    from src.data.ohlcv_collector import collect_token_data
+    data = collect_token_data(token, days_back, timeframe, exchange=exchange)
+    if data is not None:
+        with _lock:
+            cache[key] = data
+    return data
+
+
+def prewarm(tokens, days_back=None, timeframe=None, exchange="SOLANA", max_workers=4):
+    """Warm the cache for a list of tokens concurrently at cycle start."""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for token in tokens:
+            pool.submit(get_ohlcv, token, days_back, timeframe, exchange)
@@ -13,14 +13,54 @@ import threading
 import queue
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for
+from flask import Flask, render_template, jsonify, request, session, redirect, url_for, Response
 from dotenv import load_dotenv
 from flask_cors import CORS
 import signal
 import atexit
 import uuid
 import subprocess
-from functools import wraps
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# orjson for fast JSON file I/O (3-10x faster than stdlib) - optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_load_file(path):
+    """Load a JSON file using orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def json_dump_file(obj, path, indent=True):
+    """Write a JSON file atomically (tmp + os.replace) using orjson when available.
+
+    A crash mid-write can never leave a truncated file behind, so readers
+    never hit a corrupt-file reset that throws away the data.
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        tmp.write_bytes(orjson.dumps(obj, option=option))
+    else:
+        with open(tmp, 'w') as f:
+            json.dump(obj, f, indent=2 if indent else None)
+    os.replace(tmp, path)
+
+
+def json_dumps_line(obj):
+    """Serialize one object as an NDJSON line (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode()
 
 # ============================================================================
 # SETUP & CONFIGURATION
@@ -75,6 +115,11 @@ load_dotenv()
 # Load user-configured API keys into environment
 load_secrets_to_env()
 
+# Hot-path env vars read once at import - avoids re-running the
+# strip/replace cleanup chain on every request
+_HL_KEY = os.getenv("HYPER_LIQUID_ETH_PRIVATE_KEY", "").strip().replace('"', '').replace("'", "")
+_HL_ADDR = os.getenv("ACCOUNT_ADDRESS", "")
+
 # Initialize Flask with correct paths
 DASHBOARD_DIR = BASE_DIR / "dashboard"
 app = Flask(
@@ -111,16 +156,157 @@ if not all(VALID_CREDENTIALS.values()):
 # Enable CORS
 CORS(app)
 
+# Use orjson for all jsonify() responses (2-3x faster serialization, lower memory)
+# Falls back to Flask's stdlib json provider if flask-orjson isn't installed
+try:
+    from flask_orjson import OrjsonProvider
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
+    print("✅ orjson JSON provider enabled")
+except ImportError:
+    print("⚠️ flask-orjson not installed - using stdlib json provider")
+
 # Data storage directories
 DATA_DIR = BASE_DIR / "src" / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 TRADES_FILE = DATA_DIR / "trades.json"
-HISTORY_FILE = DATA_DIR / "balance_history.json"
+HISTORY_FILE = DATA_DIR / "balance_history.ndjson"
+LEGACY_HISTORY_FILE = DATA_DIR / "balance_history.json"  # pre-NDJSON format
 CONSOLE_FILE = DATA_DIR / "console_logs.json"
 AGENT_STATE_FILE = DATA_DIR / "agent_state.json"
 BACKTEST_CONSOLE_FILE = DATA_DIR / "backtest_console_logs.json"
 
+# In-memory ring buffers for balance history and trades.
+# Balance history is persisted as append-only NDJSON (one JSON object per
+# line, O(1) per append); trades still go through the deque and a daemon
+# flusher thread writes them to disk every few seconds and on shutdown.
+import collections
+
+_history_buffer = collections.deque(maxlen=100)
+_trades_buffer = collections.deque(maxlen=100)
+_buffers_dirty = threading.Event()
+_buffers_lock = threading.Lock()
+_buffer_flusher_stop = threading.Event()
+buffer_flusher_thread = None
+buffer_flusher_running = False
+BUFFER_FLUSH_INTERVAL = 5.0  # seconds
+HISTORY_MAX_LINES = 10_000   # rotate the NDJSON file past this
+HISTORY_KEEP_LINES = 1_000   # lines kept after rotation
+
+
+def _load_buffer_from_file(path, buffer):
+    """Seed a ring buffer from its JSON file at startup."""
+    try:
+        if path.exists():
+            buffer.extend(json_load_file(path))
+    except Exception as e:
+        print(f"⚠️ Failed to load {path.name}: {e}")
+
+
+def _load_history_buffer():
+    """Seed the history ring buffer from the NDJSON file (migrating the old JSON array once)."""
+    try:
+        if not HISTORY_FILE.exists() and LEGACY_HISTORY_FILE.exists():
+            with open(HISTORY_FILE, 'wb') as f:
+                for entry in json_load_file(LEGACY_HISTORY_FILE):
+                    f.write(json_dumps_line(entry))
+            print(f"🔄 Migrated {LEGACY_HISTORY_FILE.name} to NDJSON")
+
+        if HISTORY_FILE.exists():
+            with open(HISTORY_FILE, 'rb') as f:
+                lines = collections.deque(f, maxlen=_history_buffer.maxlen)
+            loads = orjson.loads if orjson is not None else json.loads
+            _history_buffer.extend(loads(line) for line in lines if line.strip())
+    except Exception as e:
+        print(f"⚠️ Failed to load balance history: {e}")
+
+
+_load_history_buffer()
+_load_buffer_from_file(TRADES_FILE, _trades_buffer)
+
+
+def flush_buffers(force=False):
+    """Write the trades ring buffer to disk if it changed."""
+    if not force and not _buffers_dirty.is_set():
+        return
+    try:
+        with _buffers_lock:
+            trades_snapshot = list(_trades_buffer)
+            _buffers_dirty.clear()
+
+        json_dump_file(trades_snapshot, TRADES_FILE, indent=False)
+    except Exception as e:
+        print(f"⚠️ Error flushing trades buffer: {e}")
+
+
+def _rotate_history_file():
+    """Truncate the NDJSON history file once it grows past HISTORY_MAX_LINES."""
+    try:
+        if not HISTORY_FILE.exists():
+            return
+        with open(HISTORY_FILE, 'rb') as f:
+            lines = f.readlines()
+        if len(lines) > HISTORY_MAX_LINES:
+            tmp = HISTORY_FILE.with_suffix('.ndjson.tmp')
+            with open(tmp, 'wb') as f:
+                f.writelines(lines[-HISTORY_KEEP_LINES:])
+            os.replace(tmp, HISTORY_FILE)
+            print(f"🔄 Rotated balance history ({len(lines)} -> {HISTORY_KEEP_LINES} lines)")
+    except Exception as e:
+        print(f"⚠️ Error rotating balance history: {e}")
+
+
+def buffer_flusher_worker():
+    """Background thread that periodically flushes the trades buffer and rotates history."""
+    while buffer_flusher_running:
+        # Event.wait doubles as an interruptible sleep (batches bursty appends)
+        _buffer_flusher_stop.wait(timeout=BUFFER_FLUSH_INTERVAL)
+        flush_buffers()
+        _rotate_history_file()
+
+    # Final flush on shutdown
+    flush_buffers(force=True)
+
+
+# Numba JIT for balance-history aggregates - optional (pure-Python fallback)
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMBA_AVAILABLE = False
+
+
+def _history_stats(arr):
+    """Min / max / mean / max drawdown over a balance series in one pass."""
+    n = len(arr)
+    lo = arr[0]
+    hi = arr[0]
+    total = 0.0
+    peak = arr[0]
+    max_dd = 0.0
+    for i in range(n):
+        v = arr[i]
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+        total += v
+        if v > peak:
+            peak = v
+        if peak > 0:
+            dd = (peak - v) / peak
+            if dd > max_dd:
+                max_dd = dd
+    return lo, hi, total / n, max_dd
+
+
+if NUMBA_AVAILABLE:
+    # Compile the tight loop once; cache=True persists it across restarts
+    _history_stats = njit(cache=True)(_history_stats)
+
 # Agent control variables
 agent_thread = None
 agent_running = False  # Always start stopped - never auto-start
@@ -134,6 +320,9 @@ websocket_positions = []
 websocket_positions_lock = threading.Lock()
 websocket_positions_updated = threading.Event()
 
+# SSE client connections for broadcasting real-time updates
+sse_clients = []
+
 # Thread synchronization
 state_lock = threading.Lock()  # Lock for agent state variables
 # log_queue imported from src.utils.logging_utils
@@ -165,8 +354,7 @@ def load_rbi_jobs():
     global rbi_jobs
     try:
         if RBI_JOBS_FILE.exists():
-            with open(RBI_JOBS_FILE, 'r') as f:
-                rbi_jobs = json.load(f)
+            rbi_jobs = json_load_file(RBI_JOBS_FILE)
     except Exception as e:
         print(f"⚠️ Failed to load RBI jobs: {e}")
         rbi_jobs = []
@@ -175,8 +363,7 @@ def load_rbi_jobs():
 def save_rbi_jobs():
     """Save RBI jobs to persistent storage."""
     try:
-        with open(RBI_JOBS_FILE, 'w') as f:
-            json.dump(rbi_jobs, f, indent=2)
+        json_dump_file(rbi_jobs, RBI_JOBS_FILE)
     except Exception as e:
         print(f"⚠️ Failed to save RBI jobs: {e}")
 
@@ -315,8 +502,9 @@ def start_rbi_worker():
     print("✅ RBI worker started")
 
 
-# Symbols list (for trading agent reference)
-SYMBOLS = [
+# Symbols tuple (for trading agent reference) - immutable so hot loops
+# iterate it without copy-on-read concerns
+SYMBOLS = (
     'ETH',        # Ethereum
     'BTC',        # Bitcoin
     'SOL',        # Solana
@@ -325,7 +513,7 @@ SYMBOLS = [
     'LTC',        # Litecoin
     'HYPE',       # Hyperliquid Exchange Token
     'FARTCOIN',   # FartCoin
-]
+)
 
 # ============================================================================
 # LOGGING UTILITIES
@@ -402,9 +590,8 @@ def log_writer_worker():
                 # 1. Write to console_logs.json (last 200 for dashboard)
                 if CONSOLE_FILE.exists():
                     try:
-                        with open(CONSOLE_FILE, 'r') as f:
-                            logs = json.load(f)
-                    except (json.JSONDecodeError, IOError):
+                        logs = json_load_file(CONSOLE_FILE)
+                    except (ValueError, IOError):
                         logs = []
                 else:
                     logs = []
@@ -416,8 +603,7 @@ def log_writer_worker():
                 logs = logs[-200:]
 
                 # Write to disk
-                with open(CONSOLE_FILE, 'w') as f:
-                    json.dump(logs, f, indent=2)
+                json_dump_file(logs, CONSOLE_FILE, indent=False)
 
                 # 2. Append to rotating log files (max 5 files, 300KB each)
                 log_file = rotate_log_files(CACHE_DIR, "app", max_files=5, max_size_kb=300)
@@ -440,16 +626,14 @@ def log_writer_worker():
         try:
             # Write to console_logs.json
             if CONSOLE_FILE.exists():
-                with open(CONSOLE_FILE, 'r') as f:
-                    logs = json.load(f)
+                logs = json_load_file(CONSOLE_FILE)
             else:
                 logs = []
 
             logs.extend(log_buffer)
             logs = logs[-200:]
 
-            with open(CONSOLE_FILE, 'w') as f:
-                json.dump(logs, f, indent=2)
+            json_dump_file(logs, CONSOLE_FILE, indent=False)
 
             # Write to rotating log file
             log_file = rotate_log_files(CACHE_DIR, "app", max_files=5, max_size_kb=300)
@@ -491,9 +675,8 @@ def backtest_log_writer_worker():
                 # Write to backtest_console_logs.json
                 if BACKTEST_CONSOLE_FILE.exists():
                     try:
-                        with open(BACKTEST_CONSOLE_FILE, 'r') as f:
-                            logs = json.load(f)
-                    except (json.JSONDecodeError, IOError):
+                        logs = json_load_file(BACKTEST_CONSOLE_FILE)
+                    except (ValueError, IOError):
                         logs = []
                 else:
                     logs = []
@@ -505,8 +688,7 @@ def backtest_log_writer_worker():
                 logs = logs[-500:]
 
                 # Write to disk
-                with open(BACKTEST_CONSOLE_FILE, 'w') as f:
-                    json.dump(logs, f, indent=2)
+                json_dump_file(logs, BACKTEST_CONSOLE_FILE, indent=False)
 
                 # Clear buffer and update timestamp
                 log_buffer.clear()
@@ -520,16 +702,14 @@ def backtest_log_writer_worker():
     if log_buffer:
         try:
             if BACKTEST_CONSOLE_FILE.exists():
-                with open(BACKTEST_CONSOLE_FILE, 'r') as f:
-                    logs = json.load(f)
+                logs = json_load_file(BACKTEST_CONSOLE_FILE)
             else:
                 logs = []
 
             logs.extend(log_buffer)
             logs = logs[-500:]
 
-            with open(BACKTEST_CONSOLE_FILE, 'w') as f:
-                json.dump(logs, f, indent=2)
+            json_dump_file(logs, BACKTEST_CONSOLE_FILE, indent=False)
         except Exception as e:
             print(f"⚠️ Backtest final log flush error: {e}")
 
@@ -542,12 +722,11 @@ def get_backtest_console_logs():
                 content = f.read()
                 if not content.strip():
                     return []
-                return json.loads(content)
+                return orjson.loads(content) if orjson else json.loads(content)
         return []
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"⚠️ Backtest console log file corrupted, resetting: {e}")
-        with open(BACKTEST_CONSOLE_FILE, 'w') as f:
-            json.dump([], f)
+        json_dump_file([], BACKTEST_CONSOLE_FILE, indent=False)
         return []
     except Exception as e:
         print(f"⚠️ Error loading backtest console logs: {e}")
@@ -563,13 +742,12 @@ try:
     from src import nice_funcs_hyperliquid as n
     from eth_account import Account
 
+    @lru_cache(maxsize=1)
     def _get_account():
-        """Standardized key lookup for dashboard and agent"""
-        key = os.getenv("HYPER_LIQUID_ETH_PRIVATE_KEY", "")
-        clean_key = key.strip().replace('"', '').replace("'", "")
-        if not clean_key:
+        """Standardized key lookup for dashboard and agent (cached - key derivation is pure CPU)"""
+        if not _HL_KEY:
             raise ValueError("HYPER_LIQUID_ETH_PRIVATE_KEY missing in .env")
-        return Account.from_key(clean_key)
+        return Account.from_key(_HL_KEY)
 
     EXCHANGE_CONNECTED = True
     print("✅ HyperLiquid functions loaded")
@@ -580,10 +758,9 @@ except ImportError:
         import nice_funcs_hyperliquid as n
         from eth_account import Account
 
+        @lru_cache(maxsize=1)
         def _get_account():
-            key = os.getenv("HYPER_LIQUID_ETH_PRIVATE_KEY", "")
-            clean_key = key.strip().replace('"', '').replace("'", "")
-            return Account.from_key(clean_key)
+            return Account.from_key(_HL_KEY)
 
         EXCHANGE_CONNECTED = True
         print("✅ HyperLiquid functions loaded from root nice_funcs_hyperliquid")
@@ -599,10 +776,53 @@ except ImportError:
             return DummyAccount()
         n = None
 
+
+@lru_cache(maxsize=1)
+def _get_account_address():
+    """Resolve the trading address once (env override or derived from the key)"""
+    return _HL_ADDR or _get_account().address
+
+
+# Bind the balance functions once at import - hasattr() walked the module
+# __dict__ on every /api/data request
+_get_bal = getattr(n, 'get_available_balance', None)
+_get_val = getattr(n, 'get_account_value', None)
+
 # ============================================================================
 # DATA COLLECTION FUNCTIONS
 # ============================================================================
 
+# Shared executor for concurrent exchange lookups (amortizes thread creation)
+_positions_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="positions")
+
+def ttl_cache(seconds=3.0):
+    """Memoize a data fetcher for a few seconds.
+
+    Absorbs browser polling: N dashboard tabs hitting /api/data become one
+    upstream exchange request per TTL window. The lock prevents a
+    thundering herd of refreshes when the cache expires.
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        cached = {"value": None, "expires": 0.0}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if time.monotonic() < cached["expires"]:
+                return cached["value"]
+            with lock:
+                # Re-check under the lock so only one thread refreshes
+                if time.monotonic() < cached["expires"]:
+                    return cached["value"]
+                value = func(*args, **kwargs)
+                cached["value"] = value
+                cached["expires"] = time.monotonic() + seconds
+                return value
+        return wrapper
+    return decorator
+
+
+@ttl_cache(seconds=3.0)
 def get_account_data():
     """Fetch live account data from HyperLiquid"""
     if not EXCHANGE_CONNECTED or n is None:
@@ -617,19 +837,11 @@ def get_account_data():
         }
     
     try:
-        account = _get_account()
-        address = os.getenv("ACCOUNT_ADDRESS", account.address)
-        
-        # Get live data using the correct function names
-        if hasattr(n, 'get_available_balance'):
-            available_balance = float(n.get_available_balance(address))
-        else:
-            available_balance = 10.0
-        
-        if hasattr(n, 'get_account_value'):
-            total_equity = float(n.get_account_value(address))
-        else:
-            total_equity = 10.0
+        address = _get_account_address()
+
+        # Get live data using the functions bound at import
+        available_balance = float(_get_bal(address)) if _get_bal else 10.0
+        total_equity = float(_get_val(address)) if _get_val else 10.0
         
         # Calculate PnL (starting balance from config or default $10)
         starting_balance = 10.0
@@ -662,6 +874,7 @@ def get_account_data():
         }
 
 
+@ttl_cache(seconds=3.0)
 def get_positions_data():
     """Fetch ALL live open positions from HyperLiquid using WebSocket (real-time)"""
     if not EXCHANGE_CONNECTED or n is None:
@@ -669,10 +882,8 @@ def get_positions_data():
         return []
 
     try:
-        # Get account
-        account = _get_account()
-        address = os.getenv("ACCOUNT_ADDRESS", account.address)
-        
+        address = _get_account_address()
+
         # Try WebSocket first for real-time data
         try:
             from src.websocket import get_data_manager, is_websocket_connected
@@ -714,7 +925,6 @@ def get_positions_data():
             print("⚠️ WebSocket module not available, falling back to API")
         except Exception as ws_err:
             print(f"⚠️ WebSocket error: {ws_err}, falling back to API")
-        address = os.getenv("ACCOUNT_ADDRESS", account.address)
 
         # Try WebSocket first for real-time data
         try:
@@ -780,6 +990,8 @@ def get_positions_data():
 
         asset_positions = user_state["assetPositions"]
 
+        # First pass: extract raw fields for non-zero positions
+        raw_positions = []
         for position in asset_positions:
             try:
                 raw_pos = position.get("position", {})
@@ -791,31 +1003,48 @@ def get_positions_data():
 
                 entry_px = float(raw_pos.get("entryPx", 0))
                 pnl_perc = float(raw_pos.get("returnOnEquity", 0)) * 100
-                is_long = pos_size > 0
-                side = "LONG" if is_long else "SHORT"
-
-                try:
-                    ask, bid, _ = n.ask_bid(symbol)
-                    mark_price = (ask + bid) / 2
-                except Exception:
-                    mark_price = entry_px
-
-                position_value = abs(pos_size) * mark_price
-
-                positions.append({
-                    "symbol": symbol,
-                    "size": float(pos_size),
-                    "entry_price": float(entry_px),
-                    "mark_price": float(mark_price),
-                    "position_value": float(position_value),
-                    "pnl_percent": float(pnl_perc),
-                    "side": side
-                })
+                raw_positions.append((symbol, pos_size, entry_px, pnl_perc))
 
             except Exception as pos_err:
                 print(f"❌ Error processing position: {pos_err}")
                 continue
 
+        # Second pass: fetch mark prices concurrently - each ask_bid is a
+        # blocking HTTPS call, so overlap them instead of paying N x RTT.
+        # A failed/slow symbol just falls back to its entry price.
+        mark_prices = {}
+        if raw_positions:
+            futures = {
+                _positions_executor.submit(n.ask_bid, symbol): symbol
+                for symbol, _, _, _ in raw_positions
+            }
+            try:
+                for future in as_completed(futures, timeout=10):
+                    symbol = futures[future]
+                    try:
+                        ask, bid, _ = future.result(timeout=2)
+                        mark_prices[symbol] = (ask + bid) / 2
+                    except Exception:
+                        pass
+            except TimeoutError:
+                print("⚠️ Mark price fetch timed out for some symbols")
+
+        for symbol, pos_size, entry_px, pnl_perc in raw_positions:
+            mark_price = mark_prices.get(symbol, entry_px)
+            is_long = pos_size > 0
+            side = "LONG" if is_long else "SHORT"
+            position_value = abs(pos_size) * mark_price
+
+            positions.append({
+                "symbol": symbol,
+                "size": float(pos_size),
+                "entry_price": float(entry_px),
+                "mark_price": float(mark_price),
+                "position_value": float(position_value),
+                "pnl_percent": float(pnl_perc),
+                "side": side
+            })
+
         print(f"📊 API: {len(positions)} positions")
         return positions
 
@@ -826,59 +1055,60 @@ def get_positions_data():
         return []
 
 
+# Throttle state for save_balance_history - /api/data polls fire it dozens
+# of times a minute with near-identical values
+_history_save_lock = threading.Lock()
+_last_history_save = 0.0
+_last_history_balance = None
+HISTORY_SAVE_INTERVAL = 60.0  # seconds between snapshots
+HISTORY_MIN_DELTA = 0.01      # skip no-op writes in quiet markets
+
+
 def save_balance_history(balance):
-    """Save balance to history (max 100 entries)"""
+    """Append a balance snapshot (O(1) NDJSON append, throttled to once a minute)"""
+    global _last_history_save, _last_history_balance
     try:
-        if HISTORY_FILE.exists():
-            with open(HISTORY_FILE, 'r') as f:
-                history = json.load(f)
-        else:
-            history = []
-        
-        # Add new entry
-        history.append({
+        balance = float(balance)
+        with _history_save_lock:
+            now = time.monotonic()
+            if now - _last_history_save < HISTORY_SAVE_INTERVAL:
+                return
+            if _last_history_balance is not None and abs(balance - _last_history_balance) < HISTORY_MIN_DELTA:
+                return
+            _last_history_save = now
+            _last_history_balance = balance
+
+        entry = {
             "timestamp": datetime.now().isoformat(),
-            "balance": float(balance)
-        })
-        
-        # Keep only last 100
-        history = history[-100:]
-        
-        with open(HISTORY_FILE, 'w') as f:
-            json.dump(history, f, indent=2)
-            
+            "balance": balance
+        }
+        with _buffers_lock:
+            _history_buffer.append(entry)
+
+        with open(HISTORY_FILE, 'ab') as f:
+            f.write(json_dumps_line(entry))
+
     except Exception as e:
         print(f"⚠️ Error saving balance history: {e}")
 
 
 def load_trades():
-    """Load recent trades from file"""
+    """Load recent trades from the in-memory ring buffer"""
     try:
-        if TRADES_FILE.exists():
-            with open(TRADES_FILE, 'r') as f:
-                trades = json.load(f)
-                return trades[-20:]  # Last 20 trades
-        return []
+        with _buffers_lock:
+            return list(_trades_buffer)[-20:]  # Last 20 trades
     except Exception as e:
         print(f"⚠️ Error loading trades: {e}")
         return []
 
 
 def save_trade(trade_data):
-    """Save a completed trade"""
+    """Save a completed trade to the ring buffer (flushed async)"""
     try:
-        if TRADES_FILE.exists():
-            with open(TRADES_FILE, 'r') as f:
-                trades = json.load(f)
-        else:
-            trades = []
-        
-        trades.append(trade_data)
-        trades = trades[-100:]  # Keep last 100
-        
-        with open(TRADES_FILE, 'w') as f:
-            json.dump(trades, f, indent=2)
-        
+        with _buffers_lock:
+            _trades_buffer.append(trade_data)
+        _buffers_dirty.set()
+
         # Log trade to console
         symbol = trade_data.get('symbol', 'Unknown')
         side = trade_data.get('side', 'LONG')
@@ -904,13 +1134,12 @@ def get_console_logs():
                 content = f.read()
                 if not content.strip():
                     return []
-                return json.loads(content)
+                return orjson.loads(content) if orjson else json.loads(content)
         return []
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"⚠️ Console log file corrupted, resetting: {e}")
         # Reset corrupted file
-        with open(CONSOLE_FILE, 'w') as f:
-            json.dump([], f)
+        json_dump_file([], CONSOLE_FILE, indent=False)
         return []
     except Exception as e:
         print(f"⚠️ Error loading console logs: {e}")
@@ -920,8 +1149,7 @@ def load_agent_state():
     """Load agent state from persistent storage"""
     try:
         if AGENT_STATE_FILE.exists():
-            with open(AGENT_STATE_FILE, 'r') as f:
-                return json.load(f)
+            return json_load_file(AGENT_STATE_FILE)
         
         # Return default state if file doesn't exist
         return {
@@ -943,8 +1171,7 @@ def load_agent_state():
 def save_agent_state(state):
     """Save agent state to persistent storage"""
     try:
-        with open(AGENT_STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        json_dump_file(state, AGENT_STATE_FILE, indent=False)
     except Exception as e:
         print(f"⚠️ Error saving agent state: {e}")
 
@@ -992,6 +1219,11 @@ def run_trading_agent():
     # Convert minutes to seconds for sleep (use user setting)
     sleep_seconds = user_settings.get('sleep_minutes', 30) * 60
 
+    # Agent instance is reused across cycles unless settings change - the
+    # constructor re-reads config and re-initializes AI models each time
+    agent = None
+    agent_settings_key = None
+
     while True:
         # Check stop condition with lock
         with state_lock:
@@ -1008,23 +1240,38 @@ def run_trading_agent():
             user_settings = load_settings()
             monitored_tokens = user_settings.get('monitored_tokens', ['ETH', 'BTC', 'SOL'])
 
-            # Create agent instance with user settings and stop callback
-            agent = TradingAgent(
-                timeframe=user_settings.get('timeframe', '30m'),
-                days_back=user_settings.get('days_back', 2),
-                stop_check_callback=should_stop_agent,
-                # Pass user-selected tokens to the agent
-                symbols=monitored_tokens,
-                # Pass AI settings
-                ai_provider=user_settings.get('ai_provider', 'openrouter'),
-                ai_model=user_settings.get('ai_model', 'x-ai/grok-4.1-fast'),
-                ai_temperature=user_settings.get('ai_temperature', 0.6),
-                ai_max_tokens=user_settings.get('ai_max_tokens', 8024),
-                # Pass swarm mode settings
-                swarm_mode=user_settings.get('swarm_mode', 'single'),
-                swarm_models=user_settings.get('swarm_models', [])
+            # Only rebuild the agent when a setting it consumes has changed
+            settings_key = (
+                user_settings.get('timeframe', '30m'),
+                user_settings.get('days_back', 2),
+                tuple(monitored_tokens),
+                user_settings.get('ai_provider', 'openrouter'),
+                user_settings.get('ai_model', 'x-ai/grok-4.1-fast'),
+                user_settings.get('ai_temperature', 0.6),
+                user_settings.get('ai_max_tokens', 8024),
+                user_settings.get('swarm_mode', 'single'),
+                json.dumps(user_settings.get('swarm_models', []), sort_keys=True),
             )
 
+            if agent is None or settings_key != agent_settings_key:
+                # Create agent instance with user settings and stop callback
+                agent = TradingAgent(
+                    timeframe=user_settings.get('timeframe', '30m'),
+                    days_back=user_settings.get('days_back', 2),
+                    stop_check_callback=should_stop_agent,
+                    # Pass user-selected tokens to the agent
+                    symbols=monitored_tokens,
+                    # Pass AI settings
+                    ai_provider=user_settings.get('ai_provider', 'openrouter'),
+                    ai_model=user_settings.get('ai_model', 'x-ai/grok-4.1-fast'),
+                    ai_temperature=user_settings.get('ai_temperature', 0.6),
+                    ai_max_tokens=user_settings.get('ai_max_tokens', 8024),
+                    # Pass swarm mode settings
+                    swarm_mode=user_settings.get('swarm_mode', 'single'),
+                    swarm_models=user_settings.get('swarm_models', [])
+                )
+                agent_settings_key = settings_key
+
             # Set executing flag to True (agent is now actively analyzing)
             with state_lock:
                 agent_executing = True
@@ -1189,14 +1436,11 @@ def index():
 def get_data():
     """API endpoint for account data and positions"""
     try:
-        account_data = get_account_data()
-        positions = get_positions_data()
-
-        response = {
-            **account_data,
-            "positions": positions,
-            "timestamp": datetime.now().isoformat()
-        }
+        # Shallow-copy the TTL-cached dict (C-level dict copy) - never mutate
+        # the cached value itself, other requests share it
+        response = dict(get_account_data())
+        response["positions"] = get_positions_data()
+        response["timestamp"] = datetime.now().isoformat()
         return jsonify(response)
     except Exception as e:
         print(f"❌ Error in /api/data: {e}")
@@ -1405,16 +1649,13 @@ def close_position_api(symbol):
                 'message': 'Exchange not connected'
             }), 503
 
-        # Get account from environment
-        from eth_account import Account
-        private_key = os.getenv("HYPER_LIQUID_ETH_PRIVATE_KEY")
-        if not private_key:
+        if not _HL_KEY:
             return jsonify({
                 'success': False,
                 'message': 'Private key not configured'
             }), 500
 
-        account = Account.from_key(private_key)
+        account = _get_account()
 
         # Close the position using kill_switch
         add_console_log(f"Closing {symbol} position manually...", "info")
@@ -1447,16 +1688,13 @@ def close_all_positions_api():
                 'message': 'Exchange not connected'
             }), 503
 
-        # Get account from environment
-        from eth_account import Account
-        private_key = os.getenv("HYPER_LIQUID_ETH_PRIVATE_KEY")
-        if not private_key:
+        if not _HL_KEY:
             return jsonify({
                 'success': False,
                 'message': 'Private key not configured'
             }), 500
 
-        account = Account.from_key(private_key)
+        account = _get_account()
 
         # Get all open positions
         positions = get_positions_data()
@@ -1510,22 +1748,57 @@ def get_history():
     """API endpoint for balance history"""
     try:
         if HISTORY_FILE.exists():
-            with open(HISTORY_FILE, 'r') as f:
-                history = json.load(f)
-                return jsonify(history)
+            # NDJSON on disk: grab the last 100 lines and join them into a
+            # JSON array without ever parsing the entries
+            with open(HISTORY_FILE, 'rb') as f:
+                lines = collections.deque(f, maxlen=100)
+            if lines:
+                body = b'[' + b','.join(line.strip() for line in lines) + b']'
+                return Response(body, mimetype='application/json')
         return jsonify([])
     except Exception as e:
         print(f"❌ Error in /api/history: {e}")
         return jsonify([])
 
 
+@app.route('/api/history/stats')
+@login_required
+def get_history_stats():
+    """API endpoint for balance history aggregates (min/max/avg/max drawdown)"""
+    try:
+        with _buffers_lock:
+            values = [float(entry.get('balance', 0)) for entry in _history_buffer]
+
+        if not values:
+            return jsonify({'count': 0})
+
+        arr = np.asarray(values, dtype=np.float64) if NUMBA_AVAILABLE else values
+        lo, hi, avg, max_dd = _history_stats(arr)
+
+        return jsonify({
+            'count': len(values),
+            'min': lo,
+            'max': hi,
+            'avg': round(avg, 2),
+            'max_drawdown_pct': round(max_dd * 100, 2)
+        })
+    except Exception as e:
+        print(f"❌ Error in /api/history/stats: {e}")
+        return jsonify({'count': 0})
+
+
 @app.route('/api/console')
 @login_required
 def get_console():
     """API endpoint for console logs"""
     try:
-        logs = get_console_logs()
-        return jsonify(logs)
+        if CONSOLE_FILE.exists():
+            # Same zero-copy trick as /api/history - the file already holds the
+            # JSON array the client expects
+            data = CONSOLE_FILE.read_bytes()
+            if data.strip():
+                return Response(data, mimetype='application/json')
+        return jsonify([])
     except Exception as e:
         print(f"❌ Error in /api/console: {e}")
         return jsonify([])
@@ -1540,8 +1813,7 @@ def clear_console():
         clear_console_logs()
 
         # Clear the log file
-        with open(CONSOLE_FILE, 'w') as f:
-            json.dump([], f)
+        json_dump_file([], CONSOLE_FILE, indent=False)
 
         return jsonify({"success": True, "message": "Console cleared"})
     except Exception as e:
@@ -1570,8 +1842,7 @@ def clear_backtest_console():
         clear_backtest_logs()
 
         # Clear the log file
-        with open(BACKTEST_CONSOLE_FILE, 'w') as f:
-            json.dump([], f)
+        json_dump_file([], BACKTEST_CONSOLE_FILE, indent=False)
 
         return jsonify({"success": True, "message": "Backtest console cleared"})
     except Exception as e:
@@ -2460,13 +2731,25 @@ def run_rbi_backtest(job_id):
         return jsonify({'error': str(e)}), 500
 
 
+# /health is probed many times a minute - cache the serialized body for 1s
+# instead of building a dict + timestamp + jsonify on every hit
+_health_lock = threading.Lock()
+_health_cache = {"body": b"", "expires": 0.0}
+
+
 @app.route('/health')
 def health_check():
     """Health check endpoint for EasyPanel"""
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat()
-    }), 200
+    now = time.monotonic()
+    if now >= _health_cache["expires"]:
+        with _health_lock:
+            if now >= _health_cache["expires"]:
+                _health_cache["body"] = (
+                    '{"status":"healthy","timestamp":"%s"}'
+                    % datetime.now().isoformat()
+                ).encode()
+                _health_cache["expires"] = now + 1.0
+    return Response(_health_cache["body"], mimetype='application/json')
 
 
 @app.route('/api/ollama/status')
@@ -2584,6 +2867,7 @@ def ollama_pull_model():
 def cleanup_and_exit(signum=None, frame=None):
     """Graceful shutdown handler."""
     global agent_running, stop_agent_flag, shutdown_in_progress, log_writer_running
+    global backtest_log_writer_running, buffer_flusher_running
 
     if shutdown_in_progress:
         return
@@ -2647,6 +2931,17 @@ def cleanup_and_exit(signum=None, frame=None):
         else:
             print("   ✅ Backtest log writer stopped")
 
+    # Stop buffer flusher thread (final flush happens in the worker)
+    print("⏹️  Stopping buffer flusher...")
+    buffer_flusher_running = False
+    _buffer_flusher_stop.set()
+
+    if buffer_flusher_thread and buffer_flusher_thread.is_alive():
+        buffer_flusher_thread.join(timeout=3)
+    else:
+        # Flusher never started (e.g. module imported, not run) - flush inline
+        flush_buffers(force=True)
+
     try:
         add_console_log("Dashboard server shutting down", "info")
         # Give a moment for final log to be queued
@@ -2669,12 +2964,23 @@ atexit.register(lambda: cleanup_and_exit() if not shutdown_in_progress else None
 # STARTUP SECTION
 # ============================================================================
 
-if __name__ == '__main__':
-    # Get port from environment or default to 5000
-    port = int(os.getenv('PORT', 5000))
+_app_initialized = False
+
+
+def init_app():
+    """One-time process initialization (WebSocket feeds, writer threads, RBI jobs).
+
+    Called from __main__ for the dev server and from the gunicorn entry
+    point ("trading_app:init_app()"). Returns the Flask app.
+    """
+    global _app_initialized
+    global log_writer_running, log_writer_thread
+    global backtest_log_writer_running, backtest_log_writer_thread
+    global buffer_flusher_running, buffer_flusher_thread
 
-    # Global list to store SSE client connections for broadcasting
-    sse_clients = []
+    if _app_initialized:
+        return app
+    _app_initialized = True
 
     # Start WebSocket feeds for real-time data
     print("📡 Starting WebSocket feeds...")
@@ -2795,11 +3101,34 @@ if __name__ == '__main__':
     backtest_log_writer_thread.start()
     print("✅ Backtest log writer started")
 
+    # Start history/trades buffer flusher thread
+    print("💾 Starting buffer flusher...")
+    buffer_flusher_running = True
+    buffer_flusher_thread = threading.Thread(target=buffer_flusher_worker, daemon=True)
+    buffer_flusher_thread.start()
+    print("✅ Buffer flusher started")
+
     # Load RBI jobs from persistent storage
     print("🔬 Loading RBI jobs...")
     load_rbi_jobs()
     print(f"✅ Loaded {len(rbi_jobs)} RBI jobs")
 
+    # Log startup messages
+    add_console_log("Dashboard server started", "info")
+
+    # Log a warning if the exchange functions failed to load
+    if not EXCHANGE_CONNECTED:
+        add_console_log("Running in DEMO mode - HyperLiquid not connected", "warning")
+
+    return app
+
+
+if __name__ == '__main__':
+    # Get port from environment or default to 5000
+    port = int(os.getenv('PORT', 5000))
+
+    init_app()
+
     # Startup Banner for Terminal
     print(f"""
 {'=' * 60}
@@ -2815,15 +3144,8 @@ Agent Status:  {'Running 🟢' if agent_running else 'Stopped 🔴'}
 Press Ctrl+C to shutdown gracefully
 """)
 
-    # Log startup messages
-    add_console_log("Dashboard server started", "info")
-
-    # Log a warning if the exchange functions failed to load
-    if not EXCHANGE_CONNECTED:
-        add_console_log("Running in DEMO mode - HyperLiquid not connected", "warning")
-
     try:
-        # Run the Flask production server
+        # Dev fallback server - production runs under gunicorn (see Dockerfile)
         app.run(
             host='0.0.0.0',
             port=port,